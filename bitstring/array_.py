@@ -3,7 +3,7 @@ import math
 import numbers
 from collections.abc import Sized
 from bitstring.exceptions import CreationError
-from typing import Union, List, Iterable, Any, Optional, BinaryIO, overload, TextIO
+from typing import Union, List, Iterable, Any, Optional, BinaryIO, overload, TextIO, Tuple, Callable
 from bitstring.bits import Bits, BitsType
 from bitstring.bitarray_ import BitArray
 from bitstring.dtypes import Dtype, dtype_register
@@ -12,10 +12,13 @@ from bitstring.bitstring_options import Options, Colour
 import copy
 import array
 import operator
+import struct
 import io
 import sys
 ElementType = Union[float, str, int, bytes, bool, Bits]
 options = Options()
+# array.array typecodes for handling raw items of each size in bytes.
+itemsize_typecodes = {array.array(t).itemsize: t for t in 'QLIHB'}
 
 
 class Array:
@@ -74,6 +77,9 @@ class Array:
                 raise TypeError(
                     "An Array with an 'auto' scale factor can only be created from an iterable of values."
                     )
+            if initializer is not None and not isinstance(initializer, Sized):
+                # The values are needed both for the scale and to initialise the Array.
+                initializer = list(initializer)
             auto_scale = self._calculate_auto_scale(initializer, dtype.name,
                 dtype.length)
             dtype = Dtype(dtype.name, dtype.length, scale=auto_scale)
@@ -84,7 +90,7 @@ class Array:
         if isinstance(initializer, numbers.Integral):
             self.data = BitArray(initializer * self._dtype.bitlength)
         elif isinstance(initializer, (Bits, bytes, bytearray, memoryview)):
-            self.data += initializer
+            self.data = BitArray(initializer)
         elif isinstance(initializer, io.BufferedReader):
             self.fromfile(initializer)
         elif initializer is not None:
@@ -92,11 +98,169 @@ class Array:
         if trailing_bits is not None:
             self.data += BitArray._create_from_bitstype(trailing_bits)
     _largest_values = None
+    _bool_dtype = None
+
+    @staticmethod
+    def _calculate_auto_scale(initializer, name: str, length: Optional[int]
+        ) ->float:
+        if Array._largest_values is None:
+            Array._largest_values = {'mxint8': Bits('0b01111111').mxint8,
+                'e2m1mxfp4': Bits('0b0111').e2m1mxfp4, 'e2m3mxfp6': Bits(
+                '0b011111').e2m3mxfp6, 'e3m2mxfp6': Bits('0b011111').
+                e3m2mxfp6, 'e4m3mxfp8': Bits('0b01111110').e4m3mxfp8,
+                'e5m2mxfp8': Bits('0b01111011').e5m2mxfp8, 'p4binary8':
+                Bits('0b01111110').p4binary8, 'p3binary8': Bits(
+                '0b01111110').p3binary8, 'float16': Bits('0x7bff').float16}
+        if f'{name}{length}' in Array._largest_values.keys():
+            # Converting through a float64 Array packs and unpacks all the values in single struct calls.
+            float_values = Array('float64', initializer).tolist()
+            if not float_values:
+                raise ValueError(
+                    "Can't calculate an 'auto' scale with an empty Array initializer."
+                    )
+            max_float_value = max(map(abs, float_values))
+            if max_float_value == 0:
+                return 1.0
+            log2 = math.floor(math.log2(max_float_value))
+            lp2 = math.floor(math.log2(Array._largest_values[
+                f'{name}{length}']))
+            lg_scale = log2 - lp2
+            if lg_scale > 127:
+                lg_scale = 127
+            elif lg_scale < -127:
+                lg_scale = -127
+            return 2 ** lg_scale
+        else:
+            raise ValueError(
+                f"Can't calculate auto scale for format '{name}{length}'. This feature is only available for these formats: {list(Array._largest_values.keys())}."
+                )
+
+    @staticmethod
+    def _comparison_dtype() ->Dtype:
+        """The dtype of the Arrays returned by comparison operators, created once and shared."""
+        if Array._bool_dtype is None:
+            Array._bool_dtype = dtype_register.get_dtype('bool', 1)
+        return Array._bool_dtype
+
+    def _set_dtype(self, new_dtype: Union[str, Dtype]) ->None:
+        if isinstance(new_dtype, Dtype):
+            self._dtype = new_dtype
+        else:
+            try:
+                dtype = Dtype(new_dtype)
+            except ValueError:
+                name_length = utils.parse_single_struct_token(new_dtype)
+                if name_length is not None:
+                    dtype = Dtype(name_length[0], name_length[1])
+                else:
+                    raise ValueError(
+                        f"Inappropriate Dtype for Array: '{new_dtype}'.")
+            if dtype.length is None:
+                raise ValueError(
+                    f"A fixed length format is needed for an Array, received '{new_dtype}'."
+                    )
+            self._dtype = dtype
+        if self._dtype.scale == 'auto':
+            raise ValueError(
+                "A Dtype with an 'auto' scale factor can only be used when creating a new Array."
+                )
+        fmt = utils.DTYPE_STRUCT_FORMATS.get((self._dtype.name, self._dtype
+            .length))
+        if fmt is None or self._dtype.scale is not None:
+            self._struct = None
+        else:
+            self._struct = struct.Struct(''.join(fmt))
+        if self._dtype.scale is None:
+            self._bfloat_endianness = utils.BFLOAT_STRUCT_ENDIANNESS.get(self._dtype.name)
+        else:
+            self._bfloat_endianness = None
+        self._read_fn = self._make_read_fn()
+
+    def _make_read_fn(self) ->Callable:
+        """Return a function reading a single item, specialised for dtypes with a struct equivalent."""
+        if self._struct is None:
+            return self._dtype.read_fn
+        unpack = self._struct.unpack
+        length = self._dtype.length
+
+        def read_fn(bs: Bits, start: int) ->ElementType:
+            return unpack(bs._bitstore.getslice(start, start + length).tobytes())[0]
+        return read_fn
 
     def _create_element(self, value: ElementType) ->Bits:
         """Create Bits from value according to the token_name and token_length"""
         return self._dtype.set_fn(value)
 
+    @staticmethod
+    def _join_elements(elements: List[Bits]) ->BitArray:
+        """Concatenate created elements into Array data, without converting each one to a BitArray."""
+        if options.lsb0:
+            elements.reverse()
+        return BitArray().join(elements)
+
+    def _struct_format(self, n: int) ->Optional[str]:
+        """Return a struct format string for n items, or None if the dtype has no struct equivalent."""
+        if self._struct is None or options.lsb0:
+            return None
+        fmt = self._struct.format
+        return f'{fmt[0]}{n}{fmt[1:]}'
+
+    def _unpack_all(self) ->Optional[Tuple[ElementType, ...]]:
+        """Return every item from a single struct unpack, or None if the dtype has no struct equivalent."""
+        if self._bfloat_endianness is not None and not options.lsb0:
+            return self._unpack_bfloats()
+        fmt = self._struct_format(len(self))
+        if fmt is None:
+            return None
+        with self.data._bitstore.tomemoryview() as buffer:
+            return struct.unpack_from(fmt, buffer)
+
+    def _pack_all(self, values: Sized) ->Optional[bytes]:
+        """Return values packed by a single struct call, or None if the dtype or values don't allow it."""
+        if self._bfloat_endianness is not None and not options.lsb0:
+            return self._pack_bfloats(values)
+        fmt = self._struct_format(len(values))
+        if fmt is None:
+            return None
+        try:
+            return struct.pack(fmt, *values)
+        except (struct.error, OverflowError, TypeError):
+            # Values needing conversion or range checks are left to _create_element.
+            return None
+
+    def _unpack_bfloats(self) ->Tuple[float, ...]:
+        """Return every bfloat item, widened to 32-bit floats and unpacked together."""
+        n = len(self)
+        data = self.data.tobytes()
+        # The bfloat bytes are the most significant half of a float32, with zeros for the rest.
+        offset = 0 if self._bfloat_endianness == '>' else 2
+        widened = bytearray(4 * n)
+        widened[offset::4] = data[0:2 * n:2]
+        widened[offset + 1::4] = data[1:2 * n:2]
+        return struct.unpack(f'{self._bfloat_endianness}{n}f', widened)
+
+    def _pack_bfloats(self, values: Sized) ->Optional[bytes]:
+        """Return values packed as 32-bit floats and truncated to bfloats, or None if they can't all be packed."""
+        try:
+            packed = struct.pack(f'{self._bfloat_endianness}{len(values)}f', *values)
+        except (struct.error, OverflowError, TypeError):
+            # Out of range values overflow to infinity in _create_element.
+            return None
+        offset = 0 if self._bfloat_endianness == '>' else 2
+        narrowed = bytearray(2 * len(values))
+        narrowed[0::2] = packed[offset::4]
+        narrowed[1::2] = packed[offset + 1::4]
+        return bytes(narrowed)
+
+    def _data_from_values(self, values: Iterable[ElementType]) ->BitArray:
+        """Return the data for a sequence of values in the Array format, created in a single step."""
+        if not isinstance(values, Sized):
+            values = list(values)
+        packed = self._pack_all(values)
+        if packed is not None:
+            return BitArray(bytes=packed)
+        return self._join_elements([self._create_element(x) for x in values])
+
     def __len__(self) ->int:
         return len(self.data) // self._dtype.length
 
@@ -112,12 +276,18 @@ class Array:
         if isinstance(key, slice):
             start, stop, step = key.indices(len(self))
             if step != 1:
-                d = BitArray()
-                for s in range(start * self._dtype.length, stop * self.
-                    _dtype.length, step * self._dtype.length):
-                    d.append(self.data[s:s + self._dtype.length])
                 a = self.__class__(self._dtype)
-                a.data = d
+                length = self._dtype.length
+                typecode = itemsize_typecodes.get(length // 8
+                    ) if length % 8 == 0 else None
+                if typecode is not None and not options.lsb0:
+                    # Whole byte items can be picked out by an array.array slice.
+                    items = array.array(typecode, self.data.tobytes()[:len(
+                        self) * length // 8])
+                    a.data = BitArray(bytes=items[key].tobytes())
+                else:
+                    a.data = self._join_elements([self.data[s:s + length] for
+                        s in range(start * length, stop * length, step * length)])
                 return a
             else:
                 a = self.__class__(self._dtype)
@@ -131,8 +301,7 @@ class Array:
                 raise IndexError(
                     f'Index {key} out of range for Array of length {len(self)}.'
                     )
-            return self._dtype.read_fn(self.data, start=self._dtype.length *
-                key)
+            return self._read_fn(self.data, start=self._dtype.length * key)
 
     @overload
     def __setitem__(self, key: slice, value: Iterable[ElementType]) ->None:
@@ -149,11 +318,8 @@ class Array:
             if not isinstance(value, Iterable):
                 raise TypeError('Can only assign an iterable to a slice.')
             if step == 1:
-                new_data = BitArray()
-                for x in value:
-                    new_data += self._create_element(x)
                 self.data[start * self._dtype.length:stop * self._dtype.length
-                    ] = new_data
+                    ] = self._data_from_values(value)
                 return
             items_in_slice = len(range(start, stop, step))
             if not isinstance(value, Sized):
@@ -174,6 +340,15 @@ class Array:
                     f'Index {key} out of range for Array of length {len(self)}.'
                     )
             start = self._dtype.length * key
+            if self._struct is not None and not options.lsb0:
+                try:
+                    packed = self._struct.pack(value)
+                except (struct.error, OverflowError, TypeError):
+                    # Values needing conversion or range checks are left to _create_element.
+                    pass
+                else:
+                    self.data.overwrite(packed, start)
+                    return
             self.data.overwrite(self._create_element(value), start)
             return
 
@@ -184,11 +359,19 @@ class Array:
                 self.data.__delitem__(slice(start * self._dtype.length, 
                     stop * self._dtype.length))
                 return
-            r = reversed(range(start, stop, step)) if step > 0 else range(start
-                , stop, step)
+            r = range(start, stop, step) if step > 0 else reversed(range(
+                start, stop, step))
+            # Keep the runs of items between the deleted ones and join them in one go.
+            length = self._dtype.length
+            kept = []
+            previous = 0
             for s in r:
-                self.data.__delitem__(slice(s * self._dtype.length, (s + 1) *
-                    self._dtype.length))
+                kept.append(self.data[previous * length:s * length])
+                previous = s + 1
+            if previous == 0:
+                return
+            kept.append(self.data[previous * length:])
+            self.data[:] = self._join_elements(kept)
         else:
             if key < 0:
                 key += len(self)
@@ -206,9 +389,39 @@ class Array:
 
     def astype(self, dtype: Union[str, Dtype]) ->Array:
         """Return Array with elements of new dtype, initialised from current Array."""
-        new_array = Array(dtype)
-        new_array.extend(self)
-        return new_array
+        # Going via a list lets both the unpacking and the packing be done in bulk where the dtypes allow it.
+        return self.__class__(dtype, self.tolist())
+
+    def extend(self, iterable: Union[Array, array.array, Iterable[Any]]
+        ) ->None:
+        if len(self.data) % self._dtype.length != 0:
+            raise ValueError(
+                f'Cannot extend Array as its data length ({len(self.data)} bits) is not a multiple of the format length ({self._dtype.length} bits).'
+                )
+        if isinstance(iterable, Array):
+            if (self._dtype.name != iterable._dtype.name or self._dtype.
+                length != iterable._dtype.length):
+                raise TypeError(
+                    f"Cannot extend an Array with format '{self._dtype}' from an Array of format '{iterable._dtype}'."
+                    )
+            self.data.append(iterable.data)
+        elif isinstance(iterable, array.array):
+            name_value = utils.parse_single_struct_token('=' + iterable.typecode)
+            if name_value is None:
+                raise ValueError(
+                    f'Cannot extend from array with typecode {iterable.typecode}.'
+                    )
+            other_dtype = dtype_register.get_dtype(*name_value, scale=None)
+            if (self._dtype.name != other_dtype.name or self._dtype.length !=
+                other_dtype.length):
+                raise ValueError(
+                    f"Cannot extend an Array with format '{self._dtype}' from an array with typecode '{iterable.typecode}'."
+                    )
+            self.data += iterable.tobytes()
+        else:
+            if isinstance(iterable, str):
+                raise TypeError("Can't extend an Array with a str.")
+            self.data += self._data_from_values(iterable)
 
     def insert(self, i: int, x: ElementType) ->None:
         """Insert a new element into the Array at position i.
@@ -219,7 +432,22 @@ class Array:
         if i < 0 or i > len(self):
             raise IndexError("Array index out of range")
         element = self._create_element(x)
-        self.data.insert(i * self._dtype.length, element)
+        self.data.insert(element, i * self._dtype.length)
+
+    def insert_many(self, i: int, values: Iterable[ElementType]) ->None:
+        """Insert new elements into the Array at position i.
+
+        The new elements are created together and inserted with a single operation,
+        which is much faster than calling insert for each one.
+
+        """
+        if isinstance(values, str):
+            raise TypeError("Can't insert a str into an Array.")
+        if i < 0:
+            i += len(self)
+        if i < 0 or i > len(self):
+            raise IndexError("Array index out of range")
+        self.data.insert(self._data_from_values(values), i * self._dtype.length)
 
     def pop(self, i: int=-1) ->ElementType:
         """Return and remove an element of the Array.
@@ -233,7 +461,7 @@ class Array:
             raise IndexError("Array index out of range")
         start = i * self._dtype.length
         end = start + self._dtype.length
-        element = self._dtype.read_fn(self.data, start=start)
+        element = self._read_fn(self.data, start=start)
         del self.data[start:end]
         return element
 
@@ -246,11 +474,19 @@ class Array:
         if self._dtype.length % 8 != 0:
             raise ValueError("Array format is not a whole number of bytes")
         bytes_per_item = self._dtype.length // 8
-        for i in range(0, len(self.data), self._dtype.length):
-            item = self.data[i:i + self._dtype.length]
-            swapped = BitArray(item)
-            swapped.byteswap()
-            self.data.overwrite(swapped, i)
+        if options.lsb0:
+            self.data.byteswap(bytes_per_item)
+            return
+        item_bytes = self.data.tobytes()[:len(self) * bytes_per_item]
+        typecode = itemsize_typecodes.get(bytes_per_item)
+        if typecode is not None:
+            a = array.array(typecode, item_bytes)
+            a.byteswap()
+            swapped = a.tobytes()
+        else:
+            swapped = b''.join(item_bytes[i:i + bytes_per_item][::-1] for i in
+                range(0, len(item_bytes), bytes_per_item))
+        self.data.overwrite(swapped, 0)
 
     def count(self, value: ElementType) ->int:
         """Return count of Array items that equal value.
@@ -260,13 +496,11 @@ class Array:
         For floating point types using a value of float('nan') will count the number of elements that are NaN.
 
         """
-        count = 0
-        for item in self:
-            if math.isnan(value) and math.isnan(item):
-                count += 1
-            elif item == value:
-                count += 1
-        return count
+        if isinstance(value, float) and math.isnan(value):
+            if self._dtype.return_type is not float:
+                return 0
+            return sum(map(math.isnan, self.tolist()))
+        return self.tolist().count(value)
 
     def tobytes(self) ->bytes:
         """Return the Array data as a bytes object, padding with zero bits if needed.
@@ -284,6 +518,16 @@ class Array:
         """
         f.write(self.tobytes())
 
+    def tolist(self) ->List[ElementType]:
+        items = self._unpack_all()
+        if items is not None:
+            return list(items)
+        read_fn = self._read_fn
+        length = self._dtype.length
+        data = self.data
+        return [read_fn(data, start=start) for start in range(0, len(self) *
+            length, length)]
+
     def pp(self, fmt: Optional[str]=None, width: int=120, show_offset: bool
         =True, stream: TextIO=sys.stdout) ->None:
         """Pretty-print the Array contents.
@@ -295,41 +539,201 @@ class Array:
         stream -- A TextIO object with a write() method. Defaults to sys.stdout.
 
         """
-        pass
+        colour = Colour(not options.no_color)
+        sep = ' '
+        dtype2 = None
+        tidy_fmt = None
+        if fmt is None:
+            fmt = self.dtype
+            dtype1 = self.dtype
+            tidy_fmt = "dtype='" + colour.purple + str(self.dtype) + "'" + colour.off
+        else:
+            token_list = utils.preprocess_tokens(fmt)
+            if len(token_list) not in [1, 2]:
+                raise ValueError(f"Only one or two tokens can be used in an Array.pp() format - '{fmt}' has {len(token_list)} tokens.")
+            name1, length1 = utils.parse_name_length_token(token_list[0])
+            dtype1 = Dtype(name1, length1)
+            if len(token_list) == 2:
+                name2, length2 = utils.parse_name_length_token(token_list[1])
+                dtype2 = Dtype(name2, length2)
+
+        token_length = dtype1.bitlength
+        if dtype2 is not None:
+            # For two types we're OK as long as they don't have different lengths given.
+            if dtype1.bitlength is not None and dtype2.bitlength is not None and dtype1.bitlength != dtype2.bitlength:
+                raise ValueError(f"Two different format lengths specified ('{fmt}'). Either specify just one, or two the same length.")
+            if token_length is None:
+                token_length = dtype2.bitlength
+        if token_length is None:
+            token_length = self.itemsize
+
+        trailing_bit_length = len(self.data) % token_length
+        format_sep = " : "  # String to insert on each line between multiple formats
+        if tidy_fmt is None:
+            tidy_fmt = colour.purple + str(dtype1) + colour.off
+            if dtype2 is not None:
+                tidy_fmt += ', ' + colour.blue + str(dtype2) + colour.off
+            tidy_fmt = "fmt='" + tidy_fmt + "'"
+        data = self.data if trailing_bit_length == 0 else self.data[0: -trailing_bit_length]
+        length = len(self.data) // token_length
+        len_str = colour.green + str(length) + colour.off
+        # Build the output in memory so that the stream only gets a single write.
+        output_stream = io.StringIO()
+        output_stream.write(f"<{self.__class__.__name__} {tidy_fmt}, length={len_str}, itemsize={token_length} bits, total data size={(len(self.data) + 7) // 8} bytes> [\n")
+        data._pp(dtype1, dtype2, token_length, width, sep, format_sep, show_offset, output_stream, False, token_length)
+        output_stream.write("]")
+        if trailing_bit_length != 0:
+            output_stream.write(" + trailing_bits = " + str(self.data[-trailing_bit_length:]))
+        output_stream.write("\n")
+        stream.write(output_stream.getvalue())
 
     def equals(self, other: Any) ->bool:
         """Return True if format and all Array items are equal."""
-        pass
+        if isinstance(other, Array):
+            if self._dtype.length != other._dtype.length:
+                return False
+            if self._dtype.name != other._dtype.name:
+                return False
+            return self.data == other.data
+        elif isinstance(other, array.array):
+            if self.trailing_bits:
+                return False
+            if self.itemsize != other.itemsize * 8:
+                return False
+            if len(self) != len(other):
+                return False
+            name_length = utils.parse_single_struct_token('=' + other.typecode)
+            if name_length is not None and self._dtype.return_type is int:
+                other_dtype = dtype_register.get_dtype(*name_length, scale=None)
+                if (self._dtype.name == other_dtype.name and self._dtype.
+                    scale is None and not options.lsb0):
+                    # Integers of the same format are equal only if their bytes are.
+                    return self.data.tobytes() == other.tobytes()
+            return self.tolist() == other.tolist()
+        return False
 
     def __iter__(self) ->Iterable[ElementType]:
-        start = 0
-        for _ in range(len(self)):
-            yield self._dtype.read_fn(self.data, start=start)
-            start += self._dtype.length
+        items = self._unpack_all()
+        if items is not None:
+            yield from items
+            return
+        read_fn = self._read_fn
+        length = self._dtype.length
+        data = self.data
+        for start in range(0, len(self) * length, length):
+            yield read_fn(data, start=start)
 
     def __copy__(self) ->Array:
         a_copy = self.__class__(self._dtype)
         a_copy.data = copy.copy(self.data)
         return a_copy
 
+    def _data_from_op(self, fn, args: Iterable[Tuple[ElementType, ...]],
+        description: str) ->BitArray:
+        """Return data in the Array format holding fn(*a) for each a in args.
+
+        Errors are collected so that a single ValueError can report how many elements failed.
+
+        """
+        results = []
+        for a in args:
+            try:
+                results.append(fn(*a))
+            except (CreationError, ZeroDivisionError, ValueError) as e:
+                results.append(e)
+        packed = self._pack_all(results)
+        if packed is not None:
+            return BitArray(bytes=packed)
+        elements = []
+        failures = index = 0
+        msg = ''
+        for i, r in enumerate(results):
+            try:
+                if isinstance(r, (CreationError, ZeroDivisionError, ValueError)):
+                    raise r
+                elements.append(self._create_element(r))
+            except (CreationError, ZeroDivisionError, ValueError) as e:
+                if failures == 0:
+                    msg = str(e)
+                    index = i
+                failures += 1
+        if failures != 0:
+            raise ValueError(
+                f'{description} caused {failures} errors. First error at index {index} was: "{msg}"'
+                )
+        return self._join_elements(elements)
+
     def _apply_op_to_all_elements(self, op, value: Union[int, float, None],
-        is_comparison: bool=False) ->Array:
-        """Apply op with value to each element of the Array and return a new Array"""
-        pass
+        is_comparison: bool=False, reverse: bool=False) ->Array:
+        """Apply op with value to each element of the Array and return a new Array.
+
+        If reverse is True then value is the left operand of op."""
+        new_array = self.__class__(self._comparison_dtype() if
+            is_comparison else self._dtype)
+        if reverse:
+
+            def partial_op(a):
+                return op(value, a)
+        elif value is not None:
+
+            def partial_op(a):
+                return op(a, value)
+        else:
+
+            def partial_op(a):
+                return op(a)
+        new_array.data = new_array._data_from_op(partial_op, zip(self),
+            f"Applying operator '{op.__name__}' to Array")
+        return new_array
 
     def _apply_op_to_all_elements_inplace(self, op, value: Union[int, float]
         ) ->Array:
         """Apply op with value to each element of the Array in place."""
-        pass
+        self.data = self._data_from_op(lambda a: op(a, value), zip(self),
+            f"Applying operator '{op.__name__}' to Array")
+        return self
 
     def _apply_bitwise_op_to_all_elements(self, op, value: BitsType) ->Array:
         """Apply op with value to each element of the Array as an unsigned integer and return a new Array"""
-        pass
+        a_copy = self[:]
+        a_copy._apply_bitwise_op_to_all_elements_inplace(op, value)
+        return a_copy
 
     def _apply_bitwise_op_to_all_elements_inplace(self, op, value: BitsType
         ) ->Array:
         """Apply op with value to each element of the Array as an unsigned integer in place."""
-        pass
+        value = BitArray._create_from_bitstype(value)
+        if len(value) != self._dtype.length:
+            raise ValueError(
+                f'Bitwise op needs a bitstring of length {self._dtype.length} to match format {self._dtype}.'
+                )
+        item_bits = len(self) * self._dtype.length
+        if item_bits != 0:
+            # Repeating value once per item lets a single op cover the whole of the data.
+            self.data[:item_bits] = op(self.data[:item_bits], value * len(self))
+        return self
+
+    def _apply_op_between_arrays(self, op, other: Array, is_comparison:
+        bool=False) ->Array:
+        if len(self) != len(other):
+            msg = (
+                f'Cannot operate element-wise on Arrays with different lengths ({len(self)} and {len(other)}).'
+                )
+            if op in [operator.add, operator.iadd]:
+                msg += ' Use extend() method to concatenate Arrays.'
+            if op in [operator.eq, operator.ne]:
+                msg += (
+                    ' Use equals() method to compare Arrays for a single boolean result.'
+                    )
+            raise ValueError(msg)
+        if is_comparison:
+            new_type = self._comparison_dtype()
+        else:
+            new_type = self._promotetype(self._dtype, other._dtype)
+        new_array = self.__class__(new_type)
+        new_array.data = new_array._data_from_op(op, zip(self, other),
+            f"Applying operator '{op.__name__}' between Arrays")
+        return new_array
 
     @classmethod
     def _promotetype(cls, type1: Dtype, type2: Dtype) ->Dtype:
@@ -454,8 +858,7 @@ class Array:
         return self._apply_op_to_all_elements(operator.add, other)
 
     def __rsub__(self, other: Union[int, float]) ->Array:
-        neg = self._apply_op_to_all_elements(operator.neg, None)
-        return neg._apply_op_to_all_elements(operator.add, other)
+        return self._apply_op_to_all_elements(operator.sub, other, reverse=True)
 
     def __rand__(self, other: BitsType) ->Array:
         return self._apply_bitwise_op_to_all_elements(operator.iand, other)
@@ -2,11 +2,12 @@ from __future__ import annotations
 import copy
 import numbers
 import re
-from collections import abc
+from collections import abc, Counter
 from typing import Union, List, Iterable, Any, Optional
 from bitstring import utils
 from bitstring.exceptions import CreationError, Error
 from bitstring.bits import Bits, BitsType, TBits
+from bitstring.bitstore import BitStore
 import bitstring.dtypes
 
 
@@ -150,7 +151,10 @@ class BitArray(Bits):
         return s_copy
 
     def __setitem__(self, key: Union[slice, int], value: BitsType) ->None:
-        if isinstance(key, numbers.Integral):
+        # Check for a plain int first as the isinstance check against the numbers ABC is relatively slow.
+        if type(key) is int:
+            self._setitem_int(key, value)
+        elif isinstance(key, numbers.Integral):
             self._setitem_int(int(key), value)
         else:
             self._setitem_slice(key, value)
@@ -209,20 +213,92 @@ class BitArray(Bits):
         return self._imul(n)
 
     def __ior__(self: TBits, bs: BitsType) ->TBits:
-        bs = self._create_from_bitstype(bs)
+        if not isinstance(bs, Bits):
+            bs = Bits._create_from_bitstype(bs)
         self._bitstore |= bs._bitstore
         return self
 
     def __iand__(self: TBits, bs: BitsType) ->TBits:
-        bs = self._create_from_bitstype(bs)
+        if not isinstance(bs, Bits):
+            bs = Bits._create_from_bitstype(bs)
         self._bitstore &= bs._bitstore
         return self
 
     def __ixor__(self: TBits, bs: BitsType) ->TBits:
-        bs = self._create_from_bitstype(bs)
+        if not isinstance(bs, Bits):
+            bs = Bits._create_from_bitstype(bs)
         self._bitstore ^= bs._bitstore
         return self
 
+    def _replace(self, old: Bits, new: Bits, start: int, end: int, count:
+        int, bytealigned: Optional[bool]) ->int:
+        if bytealigned is None:
+            bytealigned = bitstring.options.bytealigned
+        old_len = len(old)
+        if bytealigned and old_len % 8 == 0 and not bitstring.options.lsb0:
+            starting_points = self._bytealigned_starting_points(old, start, end, count)
+        elif not bitstring.options.lsb0:
+            # Each search starts from the end of the previous match, so overlapping matches are never visited.
+            starting_points = []
+            find = self._bitstore.find
+            old_bitstore = old._bitstore
+            pos = start
+            while (p := find(old_bitstore, pos, end, bytealigned)) != -1:
+                starting_points.append(p)
+                if len(starting_points) == count:
+                    break
+                pos = p + old_len
+        else:
+            # The search is done by findall, so each position found is already a match.
+            starting_points: List[int] = []
+            next_allowed = start
+            for x in self._findall(old, start, end, None, bytealigned):
+                # Can only replace here if it hasn't already been replaced!
+                if x >= next_allowed:
+                    starting_points.append(x)
+                    if len(starting_points) == count:
+                        break
+                    next_allowed = x + old_len
+        if not starting_points:
+            return 0
+        new_bitstore = new._bitstore
+        if len(new) == old_len:
+            # Nothing needs to move, so each match can be overwritten in place.
+            for p in starting_points:
+                self._bitstore[p: p + old_len] = new_bitstore
+            return len(starting_points)
+        getslice = self._bitstore.getslice
+        replacement_list = [getslice(0, starting_points[0])]
+        for this_start, next_start in zip(starting_points, starting_points[1:]):
+            replacement_list.append(new_bitstore)
+            replacement_list.append(getslice(this_start + old_len, next_start))
+        replacement_list.append(new_bitstore)
+        replacement_list.append(getslice(starting_points[-1] + old_len, None))
+        if bitstring.options.lsb0:
+            # Addition of bitarray is always on the right, so assemble from other end
+            replacement_list.reverse()
+        self._bitstore = BitStore()
+        for r in replacement_list:
+            self._bitstore += r
+        return len(starting_points)
+
+    def _bytealigned_starting_points(self, old: Bits, start: int, end: int, count: int) ->List[int]:
+        """Return the non-overlapping byte-aligned positions of a whole-byte old, found by searching the bytes."""
+        first = (start + 7) // 8 * 8
+        if first + len(old) > end:
+            return []
+        # Only whole bytes can be searched, otherwise the padding of the final byte could give a false match.
+        data = self._bitstore.getslice(first, first + (end - first) // 8 * 8).tobytes()
+        needle = old.tobytes()
+        starting_points = []
+        i = data.find(needle)
+        while i != -1:
+            starting_points.append(first + i * 8)
+            if len(starting_points) == count:
+                break
+            i = data.find(needle, i + len(needle))
+        return starting_points
+
     def replace(self, old: BitsType, new: BitsType, start: Optional[int]=
         None, end: Optional[int]=None, count: Optional[int]=None,
         bytealigned: Optional[bool]=None) ->int:
@@ -245,34 +321,18 @@ class BitArray(Bits):
         out of range.
 
         """
-        if not old:
-            raise ValueError("Empty bitstring to replace")
-        
-        start = 0 if start is None else start
-        end = len(self) if end is None else end
-        count = -1 if count is None else count
-
-        if start < 0 or end > len(self) or start > end:
-            raise ValueError("Invalid start or end values")
-
-        old_bits = Bits(old)
-        new_bits = Bits(new)
-        replacements = 0
-        pos = start
-
-        while pos <= end - len(old_bits) and replacements != count:
-            if bytealigned and pos % 8 != 0:
-                pos += 1
-                continue
-            
-            if self[pos:pos+len(old_bits)] == old_bits:
-                self[pos:pos+len(old_bits)] = new_bits
-                pos += len(new_bits)
-                replacements += 1
-            else:
-                pos += 1
-
-        return replacements
+        if count == 0:
+            return 0
+        old = Bits._create_from_bitstype(old)
+        new = Bits._create_from_bitstype(new)
+        if len(old) == 0:
+            raise ValueError('Empty bitstring cannot be replaced.')
+        start, end = self._validate_slice(start, end)
+        if new is self:
+            # Prevent self assignment woes
+            new = copy.copy(self)
+        return self._replace(old, new, start, end, 0 if count is None else
+            count, bytealigned)
 
     def insert(self, bs: BitsType, pos: int) ->None:
         """Insert bs at bit position pos.
@@ -285,9 +345,10 @@ class BitArray(Bits):
         """
         if pos < 0 or pos > len(self):
             raise ValueError("Invalid insertion position")
-        
-        bs_to_insert = Bits(bs)
-        self._bitstore = self._bitstore[:pos] + bs_to_insert._bitstore + self._bitstore[pos:]
+        bs_to_insert = Bits._create_from_bitstype(bs)
+        if bs_to_insert is self:
+            bs_to_insert = self._copy()
+        self._insert(bs_to_insert, pos)
 
     def overwrite(self, bs: BitsType, pos: int) ->None:
         """Overwrite with bs at bit position pos.
@@ -300,13 +361,8 @@ class BitArray(Bits):
         """
         if pos < 0 or pos > len(self):
             raise ValueError("Invalid overwrite position")
-        
-        bs_to_write = Bits(bs)
-        end = pos + len(bs_to_write)
-        if end > len(self):
-            self._bitstore = self._bitstore[:pos] + bs_to_write._bitstore
-        else:
-            self._bitstore = self._bitstore[:pos] + bs_to_write._bitstore + self._bitstore[end:]
+        # Any part of bs past the end of the bitstring extends it.
+        self._overwrite(Bits._create_from_bitstype(bs), pos)
 
     def append(self, bs: BitsType) ->None:
         """Append a bitstring to the current bitstring.
@@ -314,8 +370,7 @@ class BitArray(Bits):
         bs -- The bitstring to append.
 
         """
-        bs_to_append = Bits(bs)
-        self._bitstore += bs_to_append._bitstore
+        self._append(bs)
 
     def prepend(self, bs: BitsType) ->None:
         """Prepend a bitstring to the current bitstring.
@@ -323,8 +378,13 @@ class BitArray(Bits):
         bs -- The bitstring to prepend.
 
         """
-        bs_to_prepend = Bits(bs)
-        self._bitstore = bs_to_prepend._bitstore + self._bitstore
+        self._prepend(bs)
+
+    def _append_msb0(self, bs: BitsType) ->None:
+        self._addright(Bits._create_from_bitstype(bs))
+
+    def _append_lsb0(self, bs: BitsType) ->None:
+        self._addleft(Bits._create_from_bitstype(bs))
 
     def reverse(self, start: Optional[int]=None, end: Optional[int]=None
         ) ->None:
@@ -339,17 +399,13 @@ class BitArray(Bits):
         Raises ValueError if start < 0, end > len(self) or end < start.
 
         """
-        if not self:
+        start, end = self._validate_slice(start, end)
+        if start == 0 and end == len(self):
+            self._bitstore.reverse()
             return
-
-        start = 0 if start is None else start
-        end = len(self) if end is None else end
-
-        if start < 0 or end > len(self) or end < start:
-            raise ValueError("Invalid start or end values")
-
-        reversed_section = self._bitstore[start:end][::-1]
-        self._bitstore = self._bitstore[:start] + reversed_section + self._bitstore[end:]
+        s = self._bitstore.getslice(start, end)
+        s.reverse()
+        self._bitstore[start:end] = s
 
     def set(self, value: Any, pos: Optional[Union[int, Iterable[int]]]=None
         ) ->None:
@@ -366,7 +422,7 @@ class BitArray(Bits):
         bit_value = 1 if bool(value) else 0
 
         if pos is None:
-            self._bitstore = BitArray([bit_value] * len(self))._bitstore
+            self._bitstore.setall(bit_value)
         elif isinstance(pos, int):
             if pos < -len(self) or pos >= len(self):
                 raise IndexError("Bit position out of range")
@@ -374,12 +430,8 @@ class BitArray(Bits):
                 pos = len(self) + pos
             self._bitstore[pos] = bit_value
         else:
-            for p in pos:
-                if p < -len(self) or p >= len(self):
-                    raise IndexError("Bit position out of range")
-                if p < 0:
-                    p = len(self) + p
-                self._bitstore[p] = bit_value
+            # bitarray checks the positions and handles negative ones while setting them all.
+            self._bitstore.setitems(pos, bit_value)
 
     def invert(self, pos: Optional[Union[Iterable[int], int]]=None) ->None:
         """Invert one or many bits from 0 to 1 or vice versa.
@@ -391,20 +443,28 @@ class BitArray(Bits):
 
         """
         if pos is None:
-            self._bitstore = ~self._bitstore
+            self._invert_all()
         elif isinstance(pos, int):
             if pos < -len(self) or pos >= len(self):
                 raise IndexError("Bit position out of range")
             if pos < 0:
                 pos = len(self) + pos
-            self._bitstore[pos] = not self._bitstore[pos]
+            self._invert(pos)
         else:
-            for p in pos:
-                if p < -len(self) or p >= len(self):
-                    raise IndexError("Bit position out of range")
-                if p < 0:
-                    p = len(self) + p
-                self._bitstore[p] = not self._bitstore[p]
+            positions = list(pos)
+            # Mark all the positions in a mask, letting bitarray check them and deal with negative ones.
+            mask = BitStore(len(self))
+            mask.setall(0)
+            try:
+                mask.setitems(positions, 1)
+            except IndexError:
+                raise IndexError("Bit position out of range")
+            if mask.count(1) != len(positions):
+                # Some positions are repeated, and each repeat inverts that bit again.
+                length = len(self)
+                counts = Counter(p + length if p < 0 else p for p in positions)
+                mask.setitems([p for p, n in counts.items() if n % 2 == 0], 0)
+            self._bitstore ^= mask
 
     def ror(self, bits: int, start: Optional[int]=None, end: Optional[int]=None
         ) ->None:
@@ -417,26 +477,19 @@ class BitArray(Bits):
         Raises ValueError if bits < 0.
 
         """
+        if not len(self):
+            raise Error("Cannot rotate an empty bitstring.")
         if bits < 0:
             raise ValueError("Cannot rotate by a negative amount")
+        self._ror(bits, start, end)
 
-        start = 0 if start is None else start
-        end = len(self) if end is None else end
-
-        if start < 0 or end > len(self) or start >= end:
-            raise ValueError("Invalid start or end values")
-
-        if bits == 0 or start == end:
-            return
-
-        slice_len = end - start
-        bits = bits % slice_len  # Normalize rotation amount
-
+    def _ror_msb0(self, bits: int, start: Optional[int]=None, end:
+        Optional[int]=None) ->None:
+        start, end = self._validate_slice(start, end)
+        bits %= end - start
         if bits == 0:
             return
-
-        rotated = self._bitstore[end-bits:end] + self._bitstore[start:end-bits]
-        self._bitstore = self._bitstore[:start] + rotated + self._bitstore[end:]
+        self._rotate_slice(end - bits, start, end)
 
     def rol(self, bits: int, start: Optional[int]=None, end: Optional[int]=None
         ) ->None:
@@ -449,26 +502,41 @@ class BitArray(Bits):
         Raises ValueError if bits < 0.
 
         """
+        if not len(self):
+            raise Error("Cannot rotate an empty bitstring.")
         if bits < 0:
             raise ValueError("Cannot rotate by a negative amount")
+        self._rol(bits, start, end)
 
-        start = 0 if start is None else start
-        end = len(self) if end is None else end
-
-        if start < 0 or end > len(self) or start >= end:
-            raise ValueError("Invalid start or end values")
-
-        if bits == 0 or start == end:
-            return
-
-        slice_len = end - start
-        bits = bits % slice_len  # Normalize rotation amount
-
+    def _rol_msb0(self, bits: int, start: Optional[int]=None, end:
+        Optional[int]=None) ->None:
+        start, end = self._validate_slice(start, end)
+        bits %= end - start
         if bits == 0:
             return
-
-        rotated = self._bitstore[start+bits:end] + self._bitstore[start:start+bits]
-        self._bitstore = self._bitstore[:start] + rotated + self._bitstore[end:]
+        self._rotate_slice(start + bits, start, end)
+
+    def _rotate_slice(self, pos: int, start: int, end: int) ->None:
+        """Rotate the bits in [start, end) so that the bit at pos moves to start."""
+        if len(self) - end > end - start:
+            # Rotate a copy of the slice so that the bits after it don't get moved.
+            store = self._bitstore.getslice(start, end)
+            self._rotate_bitstore(store, pos - start, 0, end - start)
+            self._bitstore[start:end] = store
+        else:
+            self._rotate_bitstore(self._bitstore, pos, start, end)
+
+    @staticmethod
+    def _rotate_bitstore(store: BitStore, pos: int, start: int, end: int) ->None:
+        # Move whichever side of pos is shorter with a delete and an insert, which are both done in place.
+        if end - pos <= pos - start:
+            piece = store.getslice(pos, end)
+            del store[pos:end]
+            store[start:start] = piece
+        else:
+            piece = store.getslice(start, pos)
+            del store[start:pos]
+            store[end - len(piece):end - len(piece)] = piece
 
     def byteswap(self, fmt: Optional[Union[int, Iterable[int], str]]=None,
         start: Optional[int]=None, end: Optional[int]=None, repeat: bool=True
@@ -484,42 +552,72 @@ class BitArray(Bits):
                   as much as possible.
 
         """
-        start = 0 if start is None else start
-        end = len(self) if end is None else end
-
-        if start < 0 or end > len(self) or start > end:
-            raise ValueError("Invalid start or end values")
-
+        start_v, end_v = self._validate_slice(start, end)
         if fmt is None or fmt == 0:
-            fmt = [8] * ((end - start) // 8)
-        elif isinstance(fmt, int):
-            fmt = [8] * fmt
+            # reverse all of the whole bytes.
+            bytesizes = [(end_v - start_v) // 8]
+        elif isinstance(fmt, numbers.Integral):
+            if fmt < 0:
+                raise ValueError(f"Improper byte length {fmt}.")
+            bytesizes = [fmt]
         elif isinstance(fmt, str):
-            fmt = [int(x) * 8 for x in fmt.split(',') if x]
-        
-        fmt = [f for f in fmt if f % 8 == 0]  # Ensure all chunks are byte-aligned
-        if not fmt:
-            return 0
+            if not (m := utils.BYTESWAP_STRUCT_PACK_RE.match(fmt)):
+                raise ValueError(f"Cannot parse format string {fmt}.")
+            # Split the format string into a list of 'q', '4h' etc.
+            formatlist = re.findall(utils.STRUCT_SPLIT_RE, m.group('fmt'))
+            # Now deal with multiplicative factors, 4h -> hhhh etc.
+            bytesizes = []
+            for f in formatlist:
+                if len(f) == 1:
+                    bytesizes.append(utils.PACK_CODE_SIZE[f])
+                else:
+                    bytesizes.extend([utils.PACK_CODE_SIZE[f[-1]]] * int(f[:-1]))
+        elif isinstance(fmt, abc.Iterable):
+            bytesizes = list(fmt)
+            for bytesize in bytesizes:
+                if not isinstance(bytesize, numbers.Integral) or bytesize < 0:
+                    raise ValueError(f"Improper byte length {bytesize}.")
+        else:
+            raise TypeError("Format must be an integer, string or iterable.")
 
-        chunk_size = sum(fmt)
-        if chunk_size == 0:
+        patternsize = sum(bytesizes)
+        if not patternsize:
             return 0
-
-        repeats = 0
-        pos = start
-        while pos + chunk_size <= end:
-            for size in fmt:
-                byte_size = size // 8
-                byte_data = self._bitstore[pos:pos+size].tobytes()
-                swapped_data = byte_data[::-1]
-                self._bitstore[pos:pos+size] = BitArray(bytes=swapped_data)
-                pos += size
-            repeats += 1
-            if not repeat:
-                break
-
+        if not repeat:
+            # Just try one (set of) byteswap(s).
+            bytestart = start_v
+            for bytesize in bytesizes:
+                self._reversebytes(bytestart, bytestart + bytesize * 8)
+                bytestart += bytesize * 8
+            return 1
+        repeats = (end_v - start_v) // (patternsize * 8)
+        if not repeats:
+            return 0
+        finalbit = start_v + repeats * patternsize * 8
+        # Swap the whole region as bytes in one go rather than one slice assignment per swap.
+        data = self._bitstore.getslice(start_v, finalbit).tobytes()
+        if bitstring.options.lsb0:
+            data = data[::-1]
+        if patternsize <= repeats * len(bytesizes):
+            # Many short repeats: move each byte position of the pattern for every repeat with one extended slice.
+            swapped = bytearray(len(data))
+            pos = 0
+            for bytesize in bytesizes:
+                for j in range(bytesize):
+                    swapped[pos + j::patternsize] = data[pos + bytesize - 1 - j::patternsize]
+                pos += bytesize
+        else:
+            swapped = bytearray()
+            pos = 0
+            for _ in range(repeats):
+                for bytesize in bytesizes:
+                    swapped += data[pos:pos + bytesize][::-1]
+                    pos += bytesize
+        if bitstring.options.lsb0:
+            swapped.reverse()
+        self._bitstore[start_v:finalbit] = BitStore.frombytes(swapped)
         return repeats
 
     def clear(self) ->None:
         """Remove all bits, reset to zero length."""
-        self._bitstore = BitArray()
+        self._clear()
@@ -8,7 +8,8 @@ import array
 import io
 from collections import abc
 import functools
-from typing import Tuple, Union, List, Iterable, Any, Optional, BinaryIO, TextIO, overload, Iterator, Type, TypeVar
+import itertools
+from typing import Tuple, Union, List, Iterable, Any, Dict, Callable, Optional, BinaryIO, TextIO, overload, Iterator, Type, TypeVar
 import bitarray
 import bitarray.util
 import bitstring
@@ -23,6 +24,54 @@ BitsType = Union['Bits', str, Iterable[Any], bool, BinaryIO, bytearray,
 TBits = TypeVar('TBits', bound='Bits')
 MAX_CHARS: int = 250
 
+# Compiled once rather than parsing the format on every float interpretation. Keyed by length in bits.
+_float_structs_be: Dict[int, struct.Struct] = {16: struct.Struct('>e'), 32: struct.Struct('>f'), 64: struct.Struct('>d')}
+_float_structs_le: Dict[int, struct.Struct] = {16: struct.Struct('<e'), 32: struct.Struct('<f'), 64: struct.Struct('<d')}
+
+# Bitstore builders for the exact types most often used as auto initialisers.
+# Other types, including subclasses of these, go through the isinstance checks in _setauto_no_length_or_offset.
+_bitstore_builders: Dict[type, Callable[[Any], BitStore]] = {
+    str: lambda s: bitstore_helpers.str_to_bitstore(s),
+    bytes: lambda s: BitStore.frombytes(s),
+    bytearray: lambda s: BitStore.frombytes(s),
+    memoryview: lambda s: BitStore.frombytes(s),
+    bitarray.bitarray: lambda s: BitStore(s),
+}
+
+# Fixed length dtypes that _read_dtype_list can read straight from the bitstore in msb0 mode, given the start and
+# end positions, instead of slicing a new bitstring for each one and then interpreting it.
+_bitstore_readers: Dict[str, Callable[[BitStore, int, int], Any]] = {
+    'uint': BitStore.slice_to_uint,
+    'int': BitStore.slice_to_int,
+    'hex': BitStore.slice_to_hex,
+    'bin': BitStore.slice_to_bin,
+    'bool': lambda bitstore, start, end: bitstore.getindex_msb0(start),
+    'pad': lambda bitstore, start, end: None,
+}
+
+# Variable length dtypes that _read_dtype_list and read() interpret in place, getting the value and the new position.
+# Their read_fn would otherwise interpret a copy of everything from the position to the end of the bitstring.
+_in_place_readers: Dict[str, Callable[[Bits, int], Tuple[int, int]]] = {
+    'ue': lambda bs, pos: bs._readue(pos),
+    'se': lambda bs, pos: bs._readse(pos),
+    'uie': lambda bs, pos: bs._readuie(pos),
+    'sie': lambda bs, pos: bs._readsie(pos),
+}
+
+
+@functools.lru_cache(utils.CACHE_SIZE)
+def _compile_fmt(fmt: str, **kwargs) ->Tuple[Dtype, ...]:
+    """Return the Dtypes for a format string, so repeated reads with the same format don't parse it again."""
+    dtypes = []
+    for t in utils.preprocess_tokens(fmt):
+        try:
+            name, length = utils.parse_name_length_token(t, **kwargs)
+        except ValueError:
+            dtypes.append(Dtype('bits', int(t)))
+        else:
+            dtypes.append(Dtype(name, length))
+    return tuple(dtypes)
+
 
 class Bits:
     """A container holding an immutable sequence of bits.
@@ -61,7 +110,7 @@ class Bits:
     len -- Length of the bitstring in bits.
 
     """
-    __slots__ = '_bitstore', '_filename'
+    __slots__ = '_bitstore', '_filename', '_hash'
 
     def __init__(self, auto: Optional[Union[BitsType, int]]=None, /, length:
         Optional[int]=None, offset: Optional[int]=None, **kwargs) ->None:
@@ -109,6 +158,7 @@ class Bits:
         /, length: Optional[int]=None, offset: Optional[int]=None, pos:
         Optional[int]=None, **kwargs) ->TBits:
         x = super().__new__(cls)
+        x._hash = -1
         if auto is None and not kwargs:
             if length is not None:
                 x._bitstore = BitStore(length)
@@ -119,6 +169,18 @@ class Bits:
         x._initialise(auto, length, offset, **kwargs)
         return x
 
+    @classmethod
+    def _create_from_bitstype(cls: Type[TBits], auto: BitsType, /) ->TBits:
+        if type(auto) is cls or isinstance(auto, cls):
+            return auto
+        b = super().__new__(cls)
+        b._hash = -1
+        if (builder := _bitstore_builders.get(type(auto))) is not None:
+            b._bitstore = builder(auto)
+        else:
+            b._setauto_no_length_or_offset(auto)
+        return b
+
     def __getattr__(self, attribute: str) ->Any:
         try:
             d = Dtype(attribute)
@@ -195,15 +257,19 @@ class Bits:
         '0x1122'
 
         """
-        if isinstance(key, numbers.Integral):
+        # Exact type checks for the common int and slice keys avoid the slower numbers.Integral check.
+        if type(key) is int:
+            return bool(self._bitstore.getindex(key))
+        if type(key) is not slice and isinstance(key, numbers.Integral):
             return bool(self._bitstore.getindex(key))
         bs = super().__new__(self.__class__)
+        bs._hash = -1
         bs._bitstore = self._bitstore.getslice_withstep(key)
         return bs
 
     def __len__(self) ->int:
         """Return the length of the bitstring in bits."""
-        return self._getlength()
+        return len(self._bitstore)
 
     def __bytes__(self) ->bytes:
         return self.tobytes()
@@ -244,6 +310,9 @@ class Bits:
         True
 
         """
+        if isinstance(bs, Bits):
+            # Compare the bitarrays directly when there's nothing to convert.
+            return self._bitstore == bs._bitstore
         try:
             return self._bitstore == Bits._create_from_bitstype(bs)._bitstore
         except TypeError:
@@ -266,8 +335,9 @@ class Bits:
         """
         if len(self) == 0:
             raise bitstring.Error('Cannot invert empty bitstring.')
-        s = self._copy()
-        s._invert_all()
+        # Build the inverted bitstore in one pass rather than copying and then inverting in place.
+        s = self.__class__()
+        s._bitstore = ~self._bitstore
         return s
 
     def __lshift__(self: TBits, n: int, /) ->TBits:
@@ -280,9 +350,8 @@ class Bits:
             raise ValueError('Cannot shift by a negative amount.')
         if len(self) == 0:
             raise ValueError('Cannot shift an empty bitstring.')
-        n = min(n, len(self))
-        s = self._absolute_slice(n, len(self))
-        s._addright(Bits(n))
+        s = self.__class__()
+        s._bitstore = self._bitstore << min(n, len(self))
         return s
 
     def __rshift__(self: TBits, n: int, /) ->TBits:
@@ -295,11 +364,8 @@ class Bits:
             raise ValueError('Cannot shift by a negative amount.')
         if len(self) == 0:
             raise ValueError('Cannot shift an empty bitstring.')
-        if not n:
-            return self._copy()
-        s = self.__class__(length=min(n, len(self)))
-        n = min(n, len(self))
-        s._addright(self._absolute_slice(0, len(self) - n))
+        s = self.__class__()
+        s._bitstore = self._bitstore >> min(n, len(self))
         return s
 
     def __mul__(self: TBits, n: int, /) ->TBits:
@@ -338,6 +404,7 @@ class Bits:
             return self.copy()
         bs = Bits._create_from_bitstype(bs)
         s = object.__new__(self.__class__)
+        s._hash = -1
         s._bitstore = self._bitstore & bs._bitstore
         return s
 
@@ -363,6 +430,7 @@ class Bits:
             return self.copy()
         bs = Bits._create_from_bitstype(bs)
         s = object.__new__(self.__class__)
+        s._hash = -1
         s._bitstore = self._bitstore | bs._bitstore
         return s
 
@@ -386,6 +454,7 @@ class Bits:
         """
         bs = Bits._create_from_bitstype(bs)
         s = object.__new__(self.__class__)
+        s._hash = -1
         s._bitstore = self._bitstore ^ bs._bitstore
         return s
 
@@ -405,15 +474,37 @@ class Bits:
         bs -- The bitstring to search for.
 
         """
+        if isinstance(bs, (bytes, bytearray, memoryview)) and len(bs) != 0:
+            # Finding the bytes on a byte boundary is much quicker than a search at every bit position, so try that first.
+            whole_bytes = self._bitstore if len(self) % 8 == 0 else self._bitstore.getslice(0, len(self) // 8 * 8)
+            if bs in whole_bytes.tobytes():
+                return True
         found = Bits.find(self, bs, bytealigned=False)
         return bool(found)
 
     def __hash__(self) ->int:
         """Return an integer hash of the object."""
+        # Only the immutable classes are hashable, so the hash can be calculated once and kept.
+        # A real hash is never -1 as Python reserves that value for errors.
+        if self._hash != -1:
+            return self._hash
         if len(self) <= 2000:
-            return hash((self.tobytes(), len(self)))
+            self._hash = hash((self.tobytes(), len(self)))
         else:
-            return hash(((self[:800] + self[-800:]).tobytes(), len(self)))
+            # Read the start and end straight from the bitstore, without making new bitstrings to join.
+            length = len(self)
+            self._hash = hash((self._bitstore.getslice(0, 800).tobytes(),
+                               self._bitstore.getslice(length - 800, length).tobytes(), length))
+        return self._hash
+
+    def __setstate__(self, state: Tuple[Optional[Dict[str, Any]], Dict[str, Any]]) ->None:
+        # A subclass instance can also have a __dict__, which pickle passes as the first item.
+        if state[0]:
+            self.__dict__.update(state[0])
+        # A cached hash from another interpreter may have used a different hash seed, so it isn't restored.
+        for attribute, value in state[1].items():
+            object.__setattr__(self, attribute, value)
+        self._hash = -1
 
     def __bool__(self) ->bool:
         """Return False if bitstring is empty, otherwise return True."""
@@ -425,7 +516,29 @@ class Bits:
 
     def _setauto_no_length_or_offset(self, s: BitsType, /) ->None:
         """Set bitstring from a bitstring, file, bool, array, iterable or string."""
-        pass
+        if isinstance(s, str):
+            self._bitstore = bitstore_helpers.str_to_bitstore(s)
+        elif isinstance(s, Bits):
+            self._bitstore = s._bitstore.copy()
+        elif isinstance(s, (bytes, bytearray, memoryview)):
+            self._bitstore = BitStore.frombytes(bytearray(s))
+        elif isinstance(s, io.BytesIO):
+            self._bitstore = BitStore.frombytes(s.getvalue())
+        elif isinstance(s, io.BufferedReader):
+            self._setfile(s.name)
+        elif isinstance(s, bitarray.bitarray):
+            self._bitstore = BitStore(s)
+        elif isinstance(s, array.array):
+            self._bitstore = BitStore.frombytes(s.tobytes())
+        elif isinstance(s, abc.Iterable):
+            # Evaluate each item as True or False and let bitarray pack the bools into bits.
+            self._bitstore = BitStore(map(bool, s))
+        elif isinstance(s, numbers.Integral):
+            raise TypeError(f"It's no longer possible to auto initialise a bitstring from an integer."
+                            f" Use '{self.__class__.__name__}({s})' instead of just '{s}' as this makes it "
+                            f"clearer that a bitstring of {int(s)} zero bits will be created.")
+        else:
+            raise TypeError(f"Cannot initialise bitstring from type '{type(s)}'.")
 
     def _setauto(self, s: BitsType, length: Optional[int], offset: Optional[int], /) ->None:
         """Set bitstring from a bitstring, file, bool, array, iterable or string."""
@@ -452,7 +565,31 @@ class Bits:
     def _setfile(self, filename: str, length: Optional[int]=None, offset:
         Optional[int]=None) ->None:
         """Use file as source of bits."""
-        pass
+        with open(pathlib.Path(filename), 'rb') as source:
+            if offset is None:
+                offset = 0
+            m = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+            if offset == 0:
+                self._filename = source.name
+                self._bitstore = BitStore.frombuffer(m, length=length)
+            elif (offset % 8 == 0 and (length is None or length % 8 == 0) and not bitstring.options.lsb0 and
+                  offset + (0 if length is None else length) <= len(m) * 8):
+                # Whole bytes can use a view of the mapped file, so they aren't read into memory.
+                end = None if length is None else (offset + length) // 8
+                self._bitstore = BitStore.frombuffer(memoryview(m)[offset // 8:end])
+            else:
+                # Otherwise read into memory.
+                temp = BitStore.frombuffer(m)
+                if length is None:
+                    if offset > len(temp):
+                        raise bitstring.CreationError(
+                            f'The offset of {offset} bits is greater than the file length ({len(temp)} bits).')
+                    self._bitstore = temp.getslice(offset, None)
+                else:
+                    self._bitstore = temp.getslice(offset, offset + length)
+                    if len(self) != length:
+                        raise bitstring.CreationError(
+                            f"Can't use a length of {length} bits and an offset of {offset} bits as file length is only {len(temp)} bits.")
 
     def _setbytes(self, data: Union[bytearray, bytes, List], length: None=None
         ) ->None:
@@ -488,19 +625,33 @@ class Bits:
 
     def _setuint(self, uint: int, length: Optional[int]=None) ->None:
         """Reset the bitstring to have given unsigned int interpretation."""
-        pass
+        # If no length given, and we've previously been given a length, use it.
+        if length is None and hasattr(self, 'len') and len(self) != 0:
+            length = len(self)
+        if length is None or length == 0:
+            raise bitstring.CreationError('A non-zero length must be specified with a uint initialiser.')
+        self._bitstore = bitstore_helpers.int2bitstore(uint, length, False)
 
     def _getuint(self) ->int:
         """Return data as an unsigned int."""
-        pass
+        if len(self) == 0:
+            raise bitstring.InterpretError('Cannot interpret a zero length bitstring as an integer.')
+        return self._bitstore.slice_to_uint()
 
     def _setint(self, int_: int, length: Optional[int]=None) ->None:
         """Reset the bitstring to have given signed int interpretation."""
-        pass
+        # If no length given, and we've previously been given a length, use it.
+        if length is None and hasattr(self, 'len') and len(self) != 0:
+            length = len(self)
+        if length is None or length == 0:
+            raise bitstring.CreationError('A non-zero length must be specified with an int initialiser.')
+        self._bitstore = bitstore_helpers.int2bitstore(int_, length, True)
 
     def _getint(self) ->int:
         """Return data as a two's complement signed int."""
-        pass
+        if len(self) == 0:
+            raise bitstring.InterpretError('Cannot interpret bitstring without a length as an integer.')
+        return self._bitstore.slice_to_int()
 
     def _setuintbe(self, uintbe: int, length: Optional[int]=None) ->None:
         """Set the bitstring to a big-endian unsigned int interpretation."""
@@ -508,7 +659,9 @@ class Bits:
 
     def _getuintbe(self) ->int:
         """Return data as a big-endian two's complement unsigned int."""
-        pass
+        if len(self) % 8:
+            raise bitstring.InterpretError(f'Big-endian integers must be whole-byte. Length = {len(self)} bits.')
+        return self._getuint()
 
     def _setintbe(self, intbe: int, length: Optional[int]=None) ->None:
         """Set bitstring to a big-endian signed int interpretation."""
@@ -516,23 +669,33 @@ class Bits:
 
     def _getintbe(self) ->int:
         """Return data as a big-endian two's complement signed int."""
-        pass
+        if len(self) % 8:
+            raise bitstring.InterpretError(f'Big-endian integers must be whole-byte. Length = {len(self)} bits.')
+        return self._getint()
 
     def _getuintle(self) ->int:
         """Interpret as a little-endian unsigned int."""
-        pass
+        if len(self) % 8:
+            raise bitstring.InterpretError(f'Little-endian integers must be whole-byte. Length = {len(self)} bits.')
+        if len(self) == 0:
+            raise bitstring.InterpretError('Cannot interpret a zero length bitstring as an integer.')
+        return int.from_bytes(self._bitstore.tobytes(), 'little', signed=False)
 
     def _getintle(self) ->int:
         """Interpret as a little-endian signed int."""
-        pass
+        if len(self) % 8:
+            raise bitstring.InterpretError(f'Little-endian integers must be whole-byte. Length = {len(self)} bits.')
+        if len(self) == 0:
+            raise bitstring.InterpretError('Cannot interpret a zero length bitstring as an integer.')
+        return int.from_bytes(self._bitstore.tobytes(), 'little', signed=True)
 
     def _getfloatbe(self) ->float:
         """Interpret the whole bitstring as a big-endian float."""
-        pass
+        return _float_structs_be[len(self)].unpack(self._bitstore.tobytes())[0]
 
     def _getfloatle(self) ->float:
         """Interpret the whole bitstring as a little-endian float."""
-        pass
+        return _float_structs_le[len(self)].unpack(self._bitstore.tobytes())[0]
 
     def _setue(self, i: int) ->None:
         """Initialise bitstring with unsigned exponential-Golomb code for integer i.
@@ -540,7 +703,9 @@ class Bits:
         Raises CreationError if i < 0.
 
         """
-        pass
+        if bitstring.options.lsb0:
+            raise bitstring.CreationError('Exp-Golomb codes cannot be used in lsb0 mode.')
+        self._bitstore = bitstore_helpers.ue2bitstore(i)
 
     def _readue(self, pos: int) ->Tuple[int, int]:
         """Return interpretation of next bits as unsigned exponential-Golomb code.
@@ -549,11 +714,26 @@ class Bits:
         reading the code.
 
         """
-        pass
+        if bitstring.options.lsb0:
+            raise bitstring.ReadError("Exp-Golomb codes cannot be read in lsb0 mode.")
+        # Let bitarray find the terminating 1 rather than testing the leading zeros one at a time.
+        one_pos = self._bitstore.find_bit(1, pos)
+        if one_pos == -1:
+            raise bitstring.ReadError("Read off end of bitstring trying to read code.")
+        leadingzeros = one_pos - pos
+        if leadingzeros == 0:
+            return 0, pos + 1
+        end = one_pos + 1 + leadingzeros
+        if end > len(self):
+            raise bitstring.ReadError("Read off end of bitstring trying to read code.")
+        codenum = (1 << leadingzeros) - 1 + self._bitstore.slice_to_uint(one_pos + 1, end)
+        return codenum, end
 
     def _setse(self, i: int) ->None:
         """Initialise bitstring with signed exponential-Golomb code for integer i."""
-        pass
+        if bitstring.options.lsb0:
+            raise bitstring.CreationError('Exp-Golomb codes cannot be used in lsb0 mode.')
+        self._bitstore = bitstore_helpers.se2bitstore(i)
 
     def _readse(self, pos: int) ->Tuple[int, int]:
         """Return interpretation of next bits as a signed exponential-Golomb code.
@@ -564,7 +744,9 @@ class Bits:
         reading the code.
 
         """
-        pass
+        codenum, pos = self._readue(pos)
+        m = (codenum + 1) // 2
+        return (m, pos) if codenum % 2 else (-m, pos)
 
     def _setuie(self, i: int) ->None:
         """Initialise bitstring with unsigned interleaved exponential-Golomb code for integer i.
@@ -572,7 +754,9 @@ class Bits:
         Raises CreationError if i < 0.
 
         """
-        pass
+        if bitstring.options.lsb0:
+            raise bitstring.CreationError('Exp-Golomb codes cannot be used in lsb0 mode.')
+        self._bitstore = bitstore_helpers.uie2bitstore(i)
 
     def _readuie(self, pos: int) ->Tuple[int, int]:
         """Return interpretation of next bits as unsigned interleaved exponential-Golomb code.
@@ -581,11 +765,30 @@ class Bits:
         reading the code.
 
         """
-        pass
+        if bitstring.options.lsb0:
+            raise bitstring.ReadError("Exp-Golomb codes cannot be read in lsb0 mode.")
+        # The code is a 0 before each data bit and then a terminating 1, so the flags are every other bit.
+        # Search windows of flags that double in size, so long bitstrings aren't sliced all the way to the end.
+        length = len(self)
+        flag_count = 16
+        while True:
+            stop = min(pos + 2 * flag_count, length)
+            data_bits = self._bitstore.getslice_withstep(slice(pos, stop, 2)).find_bit(1, 0)
+            if data_bits != -1:
+                break
+            if stop == length:
+                raise bitstring.ReadError("Read off end of bitstring trying to read code.")
+            flag_count *= 2
+        codenum = 1 << data_bits
+        if data_bits:
+            codenum += self._bitstore.getslice_withstep(slice(pos + 1, pos + 2 * data_bits, 2)).slice_to_uint()
+        return codenum - 1, pos + 2 * data_bits + 1
 
     def _setsie(self, i: int) ->None:
         """Initialise bitstring with signed interleaved exponential-Golomb code for integer i."""
-        pass
+        if bitstring.options.lsb0:
+            raise bitstring.CreationError('Exp-Golomb codes cannot be used in lsb0 mode.')
+        self._bitstore = bitstore_helpers.sie2bitstore(i)
 
     def _readsie(self, pos: int) ->Tuple[int, int]:
         """Return interpretation of next bits as a signed interleaved exponential-Golomb code.
@@ -596,7 +799,13 @@ class Bits:
         reading the code.
 
         """
-        pass
+        codenum, pos = self._readuie(pos)
+        if not codenum:
+            return 0, pos
+        try:
+            return (-codenum, pos + 1) if self._bitstore.getindex(pos) else (codenum, pos + 1)
+        except IndexError:
+            raise bitstring.ReadError("Read off end of bitstring trying to read code.")
 
     def _setbin_safe(self, binstring: str, length: None=None) ->None:
         """Reset the bitstring to the value given in binstring."""
@@ -614,7 +823,7 @@ class Bits:
 
     def _getbin(self) ->str:
         """Return interpretation as a binary string."""
-        pass
+        return self._bitstore.slice_to_bin()
 
     def _setoct(self, octstring: str, length: None=None) ->None:
         """Reset the bitstring to have the value given in octstring."""
@@ -642,7 +851,10 @@ class Bits:
         Raises an InterpretError if the bitstring's length is not a multiple of 4.
 
         """
-        pass
+        if len(self) % 8 == 0:
+            # bytes.hex is faster than bitarray's nibble conversion, particularly for long bitstrings.
+            return self._bitstore.tobytes().hex()
+        return self._bitstore.slice_to_hex()
 
     def _getlength(self) ->int:
         """Return the length of the bitstring in bits."""
@@ -650,20 +862,26 @@ class Bits:
 
     def _copy(self: TBits) ->TBits:
         """Create and return a new copy of the Bits (always in memory)."""
-        new_bits = object.__new__(self.__class__)
-        new_bits._bitstore = self._bitstore.copy()
+        # Note that __copy__ may choose to return self if it's immutable. This method always makes a copy.
+        new_bits = self.__class__()
+        new_bits._bitstore = self._bitstore._copy()
         return new_bits
 
     def _slice(self: TBits, start: int, end: int) ->TBits:
         """Used internally to get a slice, without error checking."""
-        new_bits = object.__new__(self.__class__)
-        new_bits._bitstore = self._bitstore[start:end]
+        new_bits = self.__class__()
+        new_bits._bitstore = self._bitstore.getslice(start, end)
         return new_bits
 
     def _absolute_slice(self: TBits, start: int, end: int) ->TBits:
         """Used internally to get a slice, without error checking.
         Uses MSB0 bit numbering even if LSB0 is set."""
-        pass
+        if end == start:
+            return self.__class__()
+        assert start < end, f"start={start}, end={end}"
+        bs = self.__class__()
+        bs._bitstore = self._bitstore.getslice_msb0(start, end)
+        return bs
 
     def _readtoken(self, name: str, pos: int, length: Optional[int]) ->Tuple[
         Union[float, int, str, None, Bits], int]:
@@ -676,9 +894,8 @@ class Bits:
 
     def _addleft(self, bs: Bits, /) ->None:
         """Prepend a bitstring to the current bitstring."""
-        new_bitstore = bs._bitstore.copy()
-        new_bitstore.extend(self._bitstore)
-        self._bitstore = new_bitstore
+        # Insert in place rather than building a new store from the concatenation of both.
+        self._bitstore.setitem_msb0(slice(0, 0), bs._bitstore)
 
     def _truncateleft(self: TBits, bits: int, /) ->TBits:
         """Truncate bits from the start of the bitstring. Return the truncated bits."""
@@ -690,19 +907,32 @@ class Bits:
 
     def _insert(self, bs: Bits, pos: int, /) ->None:
         """Insert bs at pos."""
-        pass
+        assert 0 <= pos <= len(self)
+        self._bitstore[pos:pos] = bs._bitstore
 
     def _overwrite(self, bs: Bits, pos: int, /) ->None:
         """Overwrite with bs at pos."""
-        pass
+        assert 0 <= pos <= len(self)
+        if bs is self:
+            # Just overwriting with self, so do nothing.
+            assert pos == 0
+            return
+        self._bitstore[pos:pos + len(bs)] = bs._bitstore
 
     def _delete(self, bits: int, pos: int, /) ->None:
         """Delete bits at pos."""
-        pass
+        assert 0 <= pos <= len(self)
+        assert pos + bits <= len(self), f'pos={pos}, bits={bits}, len={len(self)}'
+        del self._bitstore[pos:pos + bits]
 
     def _reversebytes(self, start: int, end: int) ->None:
         """Reverse bytes in-place."""
-        pass
+        assert (end - start) % 8 == 0
+        # Reversing all the bits and then the bits within each byte leaves just the bytes reversed.
+        s = self._bitstore.getslice(start, end)
+        s.reverse()
+        s.bytereverse()
+        self._bitstore[start:end] = s
 
     def _invert(self, pos: int, /) ->None:
         """Flip bit at pos 1<->0."""
@@ -710,24 +940,40 @@ class Bits:
 
     def _invert_all(self) ->None:
         """Invert every bit."""
-        self._bitstore.invert_all()
+        self._bitstore.invert()
 
     def _ilshift(self: TBits, n: int, /) ->TBits:
         """Shift bits by n to the left in place. Return self."""
-        pass
+        assert 0 < n <= len(self)
+        # bitarray shifts in place, filling with zeros and keeping the length.
+        self._bitstore <<= n
+        return self
 
     def _irshift(self: TBits, n: int, /) ->TBits:
         """Shift bits by n to the right in place. Return self."""
-        pass
+        assert 0 < n <= len(self)
+        self._bitstore >>= n
+        return self
 
     def _imul(self: TBits, n: int, /) ->TBits:
         """Concatenate n copies of self in place. Return self."""
-        pass
+        assert n >= 0
+        if n == 0:
+            self._clear()
+        else:
+            # bitarray does the repetition in C, doubling the copied region each time.
+            self._bitstore *= n
+        return self
 
     def _validate_slice(self, start: Optional[int], end: Optional[int]
         ) ->Tuple[int, int]:
         """Validate start and end and return them as positive bit positions."""
-        pass
+        length = len(self)
+        start = 0 if start is None else (start + length if start < 0 else start)
+        end = length if end is None else (end + length if end < 0 else end)
+        if not 0 <= start <= end <= length:
+            raise ValueError(f"Invalid slice positions for bitstring length {length}: start={start}, end={end}.")
+        return start, end
 
     def unpack(self, fmt: Union[str, List[Union[str, int]]], **kwargs) ->List[
         Union[int, float, str, Bits, bool, bytes, None]]:
@@ -745,7 +991,94 @@ class Bits:
         See the docstring for 'read' for token examples.
 
         """
-        pass
+        return self._readlist(fmt, 0, **kwargs)[0]
+
+    def _readlist(self, fmt: Union[str, List[Union[str, int, Dtype]]], pos: int, **kwargs) ->Tuple[
+        List[Union[int, float, str, Bits, bool, bytes, None]], int]:
+        if isinstance(fmt, str):
+            fmt = [fmt]
+        # Convert to a flat list of Dtypes
+        dtype_list = []
+        for f_item in fmt:
+            if isinstance(f_item, numbers.Integral):
+                dtype_list.append(Dtype('bits', f_item))
+            elif isinstance(f_item, Dtype):
+                dtype_list.append(f_item)
+            else:
+                dtype_list.extend(_compile_fmt(f_item, **kwargs))
+        return self._read_dtype_list(dtype_list, pos)
+
+    def _read_dtype_list(self, dtypes: List[Dtype], pos: int) ->Tuple[
+        List[Union[int, float, str, Bits, bool, bytes, None]], int]:
+        has_stretchy_token = False
+        bits_after_stretchy_token = 0
+        for dtype in dtypes:
+            stretchy = dtype.bitlength is None and not dtype.variable_length
+            if stretchy:
+                if has_stretchy_token:
+                    raise bitstring.Error("It's not possible to have more than one 'filler' token.")
+                has_stretchy_token = True
+            elif has_stretchy_token:
+                if dtype.variable_length:
+                    raise bitstring.Error(f"It's not possible to parse a variable length token '{dtype}' after a 'filler' token.")
+                bits_after_stretchy_token += dtype.bitlength
+
+        # We should have precisely zero or one stretchy token
+        vals = []
+        readers = {} if bitstring.options.lsb0 else _bitstore_readers
+        run_codes = {} if bitstring.options.lsb0 else utils.DTYPE_STRUCT_FORMATS
+        bitstore = self._bitstore
+        length = len(self)
+        num_dtypes = len(dtypes)
+        run_end = 0
+        for i, dtype in enumerate(dtypes):
+            if i < run_end:
+                # Already read as part of a run.
+                continue
+            bitlength = dtype.bitlength
+            # Formats such as '100*uint8' repeat the same cached Dtype, so a run of them is found by identity.
+            if (i + 1 < num_dtypes and dtypes[i + 1] is dtype and not pos & 7 and dtype.scale is None and
+                    (code := run_codes.get((dtype.name, bitlength))) is not None):
+                run_end = i + 2
+                while run_end < num_dtypes and dtypes[run_end] is dtype:
+                    run_end += 1
+                run_bits = (run_end - i) * bitlength
+                if pos + run_bits <= length:
+                    vals.extend(struct.unpack(f'{code[0]}{run_end - i}{code[1]}',
+                                              bitstore.getslice(pos, pos + run_bits).tobytes()))
+                    pos += run_bits
+                    continue
+                run_end = 0
+            if bitlength and dtype.scale is None and (reader := readers.get(dtype.name)) is not None:
+                if pos + bitlength > length:
+                    raise bitstring.ReadError(
+                        f'Needed a length of at least {bitlength} bits, but only {length - pos} bits were available.')
+                val = reader(bitstore, pos, pos + bitlength)
+                pos += bitlength
+                if val is not None:
+                    vals.append(val)
+                continue
+            stretchy = dtype.bitlength is None and not dtype.variable_length
+            if stretchy:
+                bits_remaining = len(self) - pos
+                # Set length to the remaining bits
+                bitlength = max(bits_remaining - bits_after_stretchy_token, 0)
+                items, remainder = divmod(bitlength, dtype.bits_per_item)
+                if remainder != 0:
+                    raise ValueError(
+                        f"The '{dtype.name}' type must have a bit length that is a multiple of {dtype.bits_per_item}"
+                        f" so cannot be created from the {bitlength} bits that are available for this stretchy token.")
+                dtype = Dtype(dtype.name, items)
+            if dtype.bitlength is not None:
+                val = dtype.read_fn(self, pos)
+                pos += dtype.bitlength
+            elif dtype.scale is None and (in_place_reader := _in_place_readers.get(dtype.name)) is not None:
+                val, pos = in_place_reader(self, pos)
+            else:
+                val, pos = dtype.read_fn(self, pos)
+            if val is not None:  # Don't append pad tokens
+                vals.append(val)
+        return vals, pos
 
     def find(self, bs: BitsType, /, start: Optional[int]=None, end:
         Optional[int]=None, bytealigned: Optional[bool]=None) ->Union[Tuple
@@ -770,12 +1103,28 @@ class Bits:
         (6,)
 
         """
-        pass
+        bs = Bits._create_from_bitstype(bs)
+        if len(bs) == 0:
+            raise ValueError('Cannot find an empty bitstring.')
+        start, end = self._validate_slice(start, end)
+        ba = bitstring.options.bytealigned if bytealigned is None else bytealigned
+        return self._find(bs, start, end, ba)
+
+    def _find_lsb0(self, bs: Bits, start: int, end: int, bytealigned: bool
+        ) ->Union[Tuple[int], Tuple[()]]:
+        # A forward find in lsb0 is very like a reverse find in msb0.
+        assert start <= end
+        assert bitstring.options.lsb0
+        new_slice = bitstring.bitstore.offset_slice_indices_lsb0(slice(start, end, None), len(self))
+        msb0_start, msb0_end = self._validate_slice(new_slice.start, new_slice.stop)
+        p = self._rfind_msb0(bs, msb0_start, msb0_end, bytealigned)
+        return (len(self) - p[0] - len(bs),) if p else ()
 
     def _find_msb0(self, bs: Bits, start: int, end: int, bytealigned: bool
         ) ->Union[Tuple[int], Tuple[()]]:
         """Find first occurrence of a binary string."""
-        pass
+        p = self._bitstore.find(bs._bitstore, start, end, bytealigned)
+        return () if p == -1 else (p,)
 
     def findall(self, bs: BitsType, start: Optional[int]=None, end:
         Optional[int]=None, count: Optional[int]=None, bytealigned:
@@ -796,7 +1145,30 @@ class Bits:
         Note that all occurrences of bs are found, even if they overlap.
 
         """
-        pass
+        if count is not None and count < 0:
+            raise ValueError('In findall, count must be >= 0.')
+        bs = Bits._create_from_bitstype(bs)
+        start, end = self._validate_slice(start, end)
+        ba = bitstring.options.bytealigned if bytealigned is None else bytealigned
+        return self._findall(bs, start, end, count, ba)
+
+    def _findall_msb0(self, bs: Bits, start: int, end: int, count: Optional[int], bytealigned: bool
+                      ) ->Iterable[int]:
+        # The bitstore does the whole search, and islice stops it after count matches.
+        return itertools.islice(self._bitstore.findall_msb0(bs._bitstore, start, end, bytealigned), count)
+
+    def _findall_lsb0(self, bs: Bits, start: int, end: int, count: Optional[int], bytealigned: bool
+                      ) ->Iterable[int]:
+        assert start <= end
+        assert bitstring.options.lsb0
+        new_slice = bitstring.bitstore.offset_slice_indices_lsb0(slice(start, end, None), len(self))
+        msb0_start, msb0_end = self._validate_slice(new_slice.start, new_slice.stop)
+        # The lsb0 positions increase as the msb0 matches are found from the end backwards.
+        lsb0_positions = (len(self) - p - len(bs) for p in
+                          self._bitstore.rfindall_msb0(bs._bitstore, msb0_start, msb0_end))
+        if bytealigned:
+            lsb0_positions = (p for p in lsb0_positions if p % 8 == 0)
+        return itertools.islice(lsb0_positions, count)
 
     def rfind(self, bs: BitsType, /, start: Optional[int]=None, end:
         Optional[int]=None, bytealigned: Optional[bool]=None) ->Union[Tuple
@@ -818,12 +1190,28 @@ class Bits:
         if end < start.
 
         """
-        pass
+        bs = Bits._create_from_bitstype(bs)
+        if len(bs) == 0:
+            raise ValueError('Cannot find an empty bitstring.')
+        start, end = self._validate_slice(start, end)
+        ba = bitstring.options.bytealigned if bytealigned is None else bytealigned
+        return self._rfind(bs, start, end, ba)
 
     def _rfind_msb0(self, bs: Bits, start: int, end: int, bytealigned: bool
         ) ->Union[Tuple[int], Tuple[()]]:
         """Find final occurrence of a binary string."""
-        pass
+        p = self._bitstore.rfind(bs._bitstore, start, end, bytealigned)
+        return () if p == -1 else (p,)
+
+    def _rfind_lsb0(self, bs: Bits, start: int, end: int, bytealigned: bool
+        ) ->Union[Tuple[int], Tuple[()]]:
+        # A reverse find in lsb0 is very like a forward find in msb0.
+        assert start <= end
+        assert bitstring.options.lsb0
+        new_slice = bitstring.bitstore.offset_slice_indices_lsb0(slice(start, end, None), len(self))
+        msb0_start, msb0_end = self._validate_slice(new_slice.start, new_slice.stop)
+        p = self._find_msb0(bs, msb0_start, msb0_end, bytealigned)
+        return (len(self) - p[0] - len(bs),) if p else ()
 
     def cut(self, bits: int, start: Optional[int]=None, end: Optional[int]=
         None, count: Optional[int]=None) ->Iterator[Bits]:
@@ -837,7 +1225,15 @@ class Bits:
                  Default is to cut as many times as possible.
 
         """
-        pass
+        start_, end_ = self._validate_slice(start, end)
+        if count is not None and count < 0:
+            raise ValueError('Cannot cut - count must be >= 0.')
+        if bits <= 0:
+            raise ValueError('Cannot cut - bits must be >= 0.')
+        # Each chunk copies only its own bits, so cutting the whole bitstring copies it just once in total.
+        stop = end_ if count is None else min(end_, start_ + count * bits)
+        for pos in range(start_, stop, bits):
+            yield self._slice(pos, min(pos + bits, end_))
 
     def split(self, delimiter: BitsType, start: Optional[int]=None, end:
         Optional[int]=None, count: Optional[int]=None, bytealigned:
@@ -866,7 +1262,22 @@ class Bits:
         sequence -- A sequence of bitstrings.
 
         """
-        pass
+        s = self.__class__()
+        # Appending to a single bitarray is already amortised, so there's no need to pre-size it.
+        if len(self) == 0:
+            # Optimised version that doesn't need to add self between every item
+            for item in sequence:
+                s._addright(Bits._create_from_bitstype(item))
+            return s
+        sequence_iter = iter(sequence)
+        try:
+            s._addright(Bits._create_from_bitstype(next(sequence_iter)))
+        except StopIteration:
+            return s
+        for item in sequence_iter:
+            s._addright(self)
+            s._addright(Bits._create_from_bitstype(item))
+        return s
 
     def tobytes(self) ->bytes:
         """Return the bitstring as bytes, padding with zero bits if needed.
@@ -897,7 +1308,12 @@ class Bits:
         end -- The bit position to end at. Defaults to len(self).
 
         """
-        pass
+        prefix = self._create_from_bitstype(prefix)
+        start, end = self._validate_slice(start, end)
+        if end < start + len(prefix):
+            return False
+        # Compare the bitstores directly rather than building a new bitstring from the slice.
+        return self._bitstore.getslice(start, start + len(prefix)) == prefix._bitstore
 
     def endswith(self, suffix: BitsType, start: Optional[int]=None, end:
         Optional[int]=None) ->bool:
@@ -908,7 +1324,11 @@ class Bits:
         end -- The bit position to end at. Defaults to len(self).
 
         """
-        pass
+        suffix = self._create_from_bitstype(suffix)
+        start, end = self._validate_slice(start, end)
+        if start + len(suffix) > end:
+            return False
+        return self._bitstore.getslice(end - len(suffix), end) == suffix._bitstore
 
     def all(self, value: Any, pos: Optional[Iterable[int]]=None) ->bool:
         """Return True if one or many bits are all set to bool(value).
@@ -919,7 +1339,12 @@ class Bits:
                the same way as slice indices. Defaults to the whole bitstring.
 
         """
-        pass
+        value = 1 if bool(value) else 0
+        if pos is None:
+            return self._bitstore.all_set() if value else not self._bitstore.any_set()
+        # Gather the bits at all the positions at once and let bitarray check them.
+        bits = self._bitstore.getitems(pos)
+        return bits.all_set() if value else not bits.any_set()
 
     def any(self, value: Any, pos: Optional[Iterable[int]]=None) ->bool:
         """Return True if any of one or many bits are set to bool(value).
@@ -930,7 +1355,11 @@ class Bits:
                the same way as slice indices. Defaults to the whole bitstring.
 
         """
-        pass
+        value = 1 if bool(value) else 0
+        if pos is None:
+            return self._bitstore.any_set() if value else not self._bitstore.all_set()
+        bits = self._bitstore.getitems(pos)
+        return bits.any_set() if value else not bits.all_set()
 
     def count(self, value: Any) ->int:
         """Return count of total number of either zero or one bits.
@@ -942,23 +1371,222 @@ class Bits:
         7
 
         """
-        pass
+        # count the number of 1s (from which it's easy to work out the 0s).
+        count = self._bitstore.count(1)
+        return count if value else len(self) - count
+
+    def and_count(self, bs: BitsType, /) ->int:
+        """Return the number of 1 bits in self & bs without creating the new bitstring.
+
+        bs -- The bitstring to '&' with.
+
+        Raises ValueError if the two bitstrings have differing lengths.
+
+        >>> Bits('0xef').and_count('0x0f')
+        4
+
+        """
+        bs = Bits._create_from_bitstype(bs)
+        if len(self) != len(bs):
+            raise ValueError("Bitstrings must have the same length for and_count.")
+        return self._bitstore.count_and(bs._bitstore)
+
+    def or_count(self, bs: BitsType, /) ->int:
+        """Return the number of 1 bits in self | bs without creating the new bitstring.
+
+        bs -- The bitstring to '|' with.
+
+        Raises ValueError if the two bitstrings have differing lengths.
+
+        >>> Bits('0xe0').or_count('0x0f')
+        7
+
+        """
+        bs = Bits._create_from_bitstype(bs)
+        if len(self) != len(bs):
+            raise ValueError("Bitstrings must have the same length for or_count.")
+        return self._bitstore.count_or(bs._bitstore)
+
+    def xor_count(self, bs: BitsType, /) ->int:
+        """Return the number of 1 bits in self ^ bs without creating the new bitstring.
+
+        This is the Hamming distance between the two bitstrings.
+
+        bs -- The bitstring to '^' with.
+
+        Raises ValueError if the two bitstrings have differing lengths.
+
+        >>> Bits('0xef').xor_count('0x0f')
+        3
+
+        """
+        bs = Bits._create_from_bitstype(bs)
+        if len(self) != len(bs):
+            raise ValueError("Bitstrings must have the same length for xor_count.")
+        return self._bitstore.count_xor(bs._bitstore)
 
     @staticmethod
+    def _format_bits(bits: Bits, bits_per_group: int, sep: str, dtype:
+        Dtype, colour_start: str, colour_end: str, width: Optional[int]=None
+        ) ->Tuple[str, int]:
+        get_fn = dtype.get_fn
+        if dtype.name == 'bytes':  # Special case for bytes to print one character each.
+            get_fn = Bits._getbytes_printable
+        if dtype.name == 'bool':  # Special case for bool to print '1' or '0' instead of `True` or `False`.
+            get_fn = dtype_register.get_dtype('uint', bits_per_group).get_fn
+        if bits_per_group == 0:
+            x = str(get_fn(bits))
+        elif (dtype.name in ('bin', 'oct', 'hex') and not bitstring.options.lsb0 and
+              bits_per_group % Bits._bits_per_char(dtype.name) == 0 and
+              len(bits) % Bits._bits_per_char(dtype.name) == 0):
+            # Each group is a whole number of characters, so the line can be converted in one go and then split,
+            # rather than creating and converting a new bitstring for every group.
+            chars_per_group = bits_per_group // Bits._bits_per_char(dtype.name)
+            s = get_fn(bits)
+            x = sep.join([s[i: i + chars_per_group] for i in range(0, len(s), chars_per_group)])
+            if len(s) % chars_per_group != 0:
+                # Left-align a short final group to match the other groups.
+                x += ' ' * (chars_per_group - len(s) % chars_per_group)
+        else:
+            # Left-align for fixed width types when msb0, otherwise right-align.
+            align = '<' if dtype.name in ['bin', 'oct', 'hex', 'bits', 'bytes'] and not bitstring.options.lsb0 else '>'
+            chars_per_group = 0
+            if dtype_register[dtype.name].bitlength2chars_fn is not None:
+                chars_per_group = dtype_register[dtype.name].bitlength2chars_fn(bits_per_group)
+            x = sep.join(f"{str(get_fn(b)): {align}{chars_per_group}}" for b in bits.cut(bits_per_group))
+
+        chars_used = len(x)
+        padding_spaces = 0 if width is None else max(width - len(x), 0)
+        x = colour_start + x + colour_end
+        # Pad final line with spaces to align it
+        if bitstring.options.lsb0:
+            x = ' ' * padding_spaces + x
+        else:
+            x += ' ' * padding_spaces
+        return x, chars_used
+
+    @staticmethod
+    @functools.lru_cache(32)
     def _chars_per_group(bits_per_group: int, fmt: Optional[str]):
         """How many characters are needed to represent a number of bits with a given format."""
-        pass
+        if fmt is None or dtype_register[fmt].bitlength2chars_fn is None:
+            return 0
+        return dtype_register[fmt].bitlength2chars_fn(bits_per_group)
 
     @staticmethod
+    @functools.lru_cache(32)
     def _bits_per_char(fmt: str):
         """How many bits are represented by each character of a given format."""
-        pass
+        if fmt not in ['bin', 'oct', 'hex', 'bytes']:
+            raise ValueError
+        return 24 // dtype_register[fmt].bitlength2chars_fn(24)
 
     def _pp(self, dtype1: Dtype, dtype2: Optional[Dtype], bits_per_group:
         int, width: int, sep: str, format_sep: str, show_offset: bool,
         stream: TextIO, lsb0: bool, offset_factor: int) ->None:
         """Internal pretty print method."""
-        pass
+        colour = Colour(not bitstring.options.no_color)
+        name1 = dtype1.name
+        name2 = dtype2.name if dtype2 is not None else None
+        if dtype1.variable_length:
+            raise ValueError(f"Can't use Dtype '{dtype1}' in pp() as it has a variable length.")
+        if dtype2 is not None and dtype2.variable_length:
+            raise ValueError(f"Can't use Dtype '{dtype2}' in pp() as it has a variable length.")
+        offset_width = 0
+        offset_sep = ' :' if lsb0 else ': '
+        if show_offset:
+            # This could be 1 too large in some circumstances. Slightly recurrent logic needed to fix it...
+            offset_width = len(str(len(self))) + len(offset_sep)
+        if bits_per_group > 0:
+            group_chars1 = Bits._chars_per_group(bits_per_group, name1)
+            group_chars2 = Bits._chars_per_group(bits_per_group, name2)
+            # The number of characters that get added when we add an extra group (after the first one)
+            total_group_chars = group_chars1 + group_chars2 + len(sep) + len(sep) * bool(group_chars2)
+            width_excluding_offset_and_final_group = width - offset_width - group_chars1 - group_chars2 - len(
+                format_sep) * bool(group_chars2)
+            width_excluding_offset_and_final_group = max(width_excluding_offset_and_final_group, 0)
+            groups_per_line = 1 + width_excluding_offset_and_final_group // total_group_chars
+            max_bits_per_line = groups_per_line * bits_per_group  # Number of bits represented on each line
+        else:
+            assert bits_per_group == 0  # Don't divide into groups
+            width_available = width - offset_width - len(format_sep) * (name2 is not None)
+            width_available = max(width_available, 1)
+            if name2 is None:
+                max_bits_per_line = width_available * Bits._bits_per_char(name1)
+            else:
+                chars_per_24_bits = dtype_register[name1].bitlength2chars_fn(24) + dtype_register[name2].bitlength2chars_fn(24)
+                max_bits_per_line = 24 * (width_available // chars_per_24_bits)
+                if max_bits_per_line == 0:
+                    max_bits_per_line = 24  # We can't fit into the width asked for. Show something small.
+        assert max_bits_per_line > 0
+
+        bitpos = 0
+        first_fb_width = second_fb_width = None
+        # The lines are collected and written in one go, as the stream could be slow to write to.
+        lines = []
+        for bits in self.cut(max_bits_per_line):
+            offset_str = ''
+            if show_offset:
+                offset = bitpos // offset_factor
+                bitpos += len(bits)
+                if bitstring.options.lsb0:
+                    offset_str = colour.green + offset_sep + f'{offset: <{offset_width - len(offset_sep)}}' + colour.off
+                else:
+                    offset_str = colour.green + f'{offset: >{offset_width - len(offset_sep)}}' + offset_sep + colour.off
+
+            fb1, chars_used = Bits._format_bits(bits, bits_per_group, sep, dtype1, colour.purple, colour.off, first_fb_width)
+            if first_fb_width is None:
+                first_fb_width = chars_used
+
+            fb2 = ''
+            if dtype2 is not None:
+                fb2, chars_used = Bits._format_bits(bits, bits_per_group, sep, dtype2, colour.blue, colour.off, second_fb_width)
+                if second_fb_width is None:
+                    second_fb_width = chars_used
+                fb2 = format_sep + fb2
+
+            if bitstring.options.lsb0 is True:
+                line_fmt = fb1 + fb2 + offset_str + '\n'
+            else:
+                line_fmt = offset_str + fb1 + fb2 + '\n'
+            lines.append(line_fmt)
+        stream.write(''.join(lines))
+        return
+
+    @staticmethod
+    def _process_pp_tokens(token_list, fmt):
+        if len(token_list) not in [1, 2]:
+            raise ValueError(
+                f"Only one or two tokens can be used in an pp() format - '{fmt}' has {len(token_list)} tokens.")
+        has_length_in_fmt = True
+        name1, length1 = utils.parse_name_length_token(token_list[0])
+        dtype1 = Dtype(name1, length1)
+        bits_per_group = dtype1.bitlength
+        dtype2 = None
+
+        if len(token_list) == 2:
+            name2, length2 = utils.parse_name_length_token(token_list[1])
+            dtype2 = Dtype(name2, length2)
+            if None not in {dtype1.bitlength, dtype2.bitlength} and dtype1.bitlength != dtype2.bitlength:
+                raise ValueError(
+                    f"Differing bit lengths of {dtype1.bitlength} and {dtype2.bitlength} in format string '{fmt}'.")
+            if bits_per_group is None:
+                bits_per_group = dtype2.bitlength
+
+        if bits_per_group is None:
+            has_length_in_fmt = False
+            if len(token_list) == 1:
+                bits_per_group = {'bin': 8, 'hex': 8, 'oct': 12, 'bytes': 32}.get(dtype1.name)
+                if bits_per_group is None:
+                    raise ValueError(f"No length or default length available for pp() format '{fmt}'.")
+            else:
+                try:
+                    bits_per_group = 2 * Bits._bits_per_char(dtype1.name) * Bits._bits_per_char(dtype2.name)
+                except ValueError:
+                    raise ValueError(f"Can't find a default bitlength to use for pp() format '{fmt}'.")
+                if bits_per_group >= 24:
+                    bits_per_group //= 2
+        return dtype1, dtype2, bits_per_group, has_length_in_fmt
 
     def pp(self, fmt: Optional[str]=None, width: int=120, sep: str=' ',
         show_offset: bool=True, stream: TextIO=sys.stdout) ->None:
@@ -978,7 +1606,28 @@ class Bits:
         >>> s.pp('b, h', sep='_', show_offset=False)
 
         """
-        pass
+        colour = Colour(not bitstring.options.no_color)
+        if fmt is None:
+            fmt = 'bin, hex' if len(self) % 8 == 0 and len(self) >= 8 else 'bin'
+        token_list = utils.preprocess_tokens(fmt)
+        dtype1, dtype2, bits_per_group, has_length_in_fmt = Bits._process_pp_tokens(token_list, fmt)
+        trailing_bit_length = len(self) % bits_per_group if has_length_in_fmt and bits_per_group else 0
+        data = self if trailing_bit_length == 0 else self[0: -trailing_bit_length]
+        format_sep = " : "  # String to insert on each line between multiple formats
+        tidy_fmt = colour.purple + str(dtype1) + colour.off
+        if dtype2 is not None:
+            tidy_fmt += ', ' + colour.blue + str(dtype2) + colour.off
+        output_stream = io.StringIO()
+        len_str = colour.green + str(len(self)) + colour.off
+        output_stream.write(f"<{self.__class__.__name__}, fmt='{tidy_fmt}', length={len_str} bits> [\n")
+        data._pp(dtype1, dtype2, bits_per_group, width, sep, format_sep, show_offset,
+                 output_stream, bitstring.options.lsb0, 1)
+        output_stream.write("]")
+        if trailing_bit_length != 0:
+            output_stream.write(" + trailing_bits = " + str(self[-trailing_bit_length:]))
+        output_stream.write("\n")
+        stream.write(output_stream.getvalue())
+        return
 
     def copy(self: TBits) ->TBits:
         """Return a copy of the bitstring."""
@@ -987,6 +1636,9 @@ class Bits:
     @classmethod
     def fromstring(cls: TBits, s: str, /) ->TBits:
         """Create a new bitstring from a formatted string."""
-        pass
+        x = super().__new__(cls)
+        x._hash = -1
+        x._bitstore = bitstore_helpers.str_to_bitstore(s)
+        return x
     len = length = property(_getlength, doc=
         'The length of the bitstring in bits. Read only.')
@@ -1,9 +1,40 @@
 from __future__ import annotations
 import bitarray
+import bitarray.util
 from bitstring.exceptions import CreationError
 from typing import Union, Iterable, Optional, overload, Iterator, Any
 
 
+def offset_slice_indices_lsb0(key: slice, length: int) ->slice:
+    # First convert slice to all integers
+    # Length already should take account of the offset
+    start, stop, step = key.indices(length)
+    new_start = length - stop
+    new_stop = length - start
+    # For negative step we sometimes get a negative stop, which can't be used correctly in a new slice
+    return slice(new_start, None if new_stop < 0 else new_stop, step)
+
+
+def offset_start_stop_lsb0(start: Optional[int], stop: Optional[int], length: int) ->tuple[int, int]:
+    # First convert slice to all integers
+    # Length already should take account of the offset
+    start, stop, _ = slice(start, stop, None).indices(length)
+    new_start = length - stop
+    new_stop = length - start
+    return new_start, new_stop
+
+
+def range_as_slice(positions: Iterable[int], length: int) ->Optional[slice]:
+    """Return a slice for the same bits as a range of positions, or None if it isn't a range of valid positions."""
+    if type(positions) is not range or not positions:
+        return None
+    first, last = positions[0], positions[-1]
+    if not (0 <= first < length and 0 <= last < length):
+        return None
+    # A negative stop would count from the end, but as every position is valid the slice can just run to the end.
+    return slice(first, None if positions.stop < 0 else positions.stop, positions.step)
+
+
 class BitStore:
     """A light wrapper around bitarray that does the LSB0 stuff"""
     __slots__ = '_bitarray', 'modified_length', 'immutable'
@@ -14,8 +45,40 @@ class BitStore:
         self.immutable = immutable
         self.modified_length = None
 
+    @classmethod
+    def frombytes(cls, b: Union[bytes, bytearray, memoryview], /) ->BitStore:
+        ba = bitarray.bitarray()
+        ba.frombytes(b)
+        return cls.frombitarray(ba)
+
+    @classmethod
+    def frombuffer(cls, buffer, /, length: Optional[int]=None) ->BitStore:
+        x = super().__new__(cls)
+        x._bitarray = bitarray.bitarray(buffer=buffer)
+        x.immutable = True
+        x.modified_length = length
+        # Here 'modified' means it shouldn't be changed further, so setting, deleting etc. are disallowed.
+        if x.modified_length is not None:
+            if x.modified_length < 0:
+                raise CreationError("Can't create bitstring with a negative length.")
+            if x.modified_length > len(x._bitarray):
+                raise CreationError(
+                    f"Can't create bitstring with a length of {x.modified_length} from {len(x._bitarray)} bits of data.")
+        return x
+
+    @classmethod
+    def frombitarray(cls, ba: bitarray.bitarray, /) ->BitStore:
+        """Wrap a newly made bitarray without copying it, so nothing else should hold a reference to it."""
+        # object.__new__ is called directly as it's quicker than going through super().
+        x = object.__new__(cls)
+        x._bitarray = ba
+        x.immutable = False
+        x.modified_length = None
+        return x
+
     def __iadd__(self, other: BitStore, /) ->BitStore:
-        self._bitarray += other._bitarray
+        # Only a store with a modified length needs slicing first, so check inline to keep appends cheap.
+        self._bitarray += other._bitarray if other.modified_length is None else other._slice_bitarray(None, None)
         return self
 
     def __add__(self, other: BitStore, /) ->BitStore:
@@ -24,59 +87,423 @@ class BitStore:
         return bs
 
     def __eq__(self, other: Any, /) ->bool:
-        return self._bitarray == other._bitarray
+        if not isinstance(other, BitStore):
+            return NotImplemented
+        if self.modified_length is None and other.modified_length is None:
+            # bitarray compares the lengths in C before any of the data, so there's no need to check them first.
+            return self._bitarray == other._bitarray
+        return len(self) == len(other) and self._slice_bitarray(None, None) == other._slice_bitarray(None, None)
 
     def __and__(self, other: BitStore, /) ->BitStore:
-        return BitStore(self._bitarray & other._bitarray)
+        # bitarray makes a single new bitarray for the result, which the new BitStore adopts without copying.
+        return BitStore.frombitarray(self._slice_bitarray(None, None) & other._slice_bitarray(None, None))
 
     def __or__(self, other: BitStore, /) ->BitStore:
-        return BitStore(self._bitarray | other._bitarray)
+        return BitStore.frombitarray(self._slice_bitarray(None, None) | other._slice_bitarray(None, None))
 
     def __xor__(self, other: BitStore, /) ->BitStore:
-        return BitStore(self._bitarray ^ other._bitarray)
+        return BitStore.frombitarray(self._slice_bitarray(None, None) ^ other._slice_bitarray(None, None))
+
+    def __invert__(self) ->BitStore:
+        return BitStore.frombitarray(~self._slice_bitarray(None, None))
 
     def __iand__(self, other: BitStore, /) ->BitStore:
-        self._bitarray &= other._bitarray
+        self._bitarray &= other._slice_bitarray(None, None)
         return self
 
     def __ior__(self, other: BitStore, /) ->BitStore:
-        self._bitarray |= other._bitarray
+        self._bitarray |= other._slice_bitarray(None, None)
         return self
 
     def __ixor__(self, other: BitStore, /) ->BitStore:
-        self._bitarray ^= other._bitarray
+        self._bitarray ^= other._slice_bitarray(None, None)
+        return self
+
+    def __imul__(self, n: int, /) ->BitStore:
+        self._bitarray *= n
+        return self
+
+    def __lshift__(self, n: int, /) ->BitStore:
+        # The shifted bits and the zero fill are written into a single new bitarray.
+        return BitStore.frombitarray(self._slice_bitarray(None, None) << n)
+
+    def __rshift__(self, n: int, /) ->BitStore:
+        return BitStore.frombitarray(self._slice_bitarray(None, None) >> n)
+
+    def __ilshift__(self, n: int, /) ->BitStore:
+        self._bitarray <<= n
+        return self
+
+    def __irshift__(self, n: int, /) ->BitStore:
+        self._bitarray >>= n
         return self
 
-    def __iter__(self) ->Iterable[bool]:
-        for i in range(len(self)):
-            yield self.getindex(i)
+    def iter_msb0(self) ->Iterator[bool]:
+        # Iterating over the bitarray is done in C, so there's no per-bit getindex call.
+        return map(bool, self._slice_bitarray(None, None))
+
+    def iter_lsb0(self) ->Iterator[bool]:
+        # Index 0 is the final bit, so iterate over a reversed copy.
+        return map(bool, self._slice_bitarray(None, None)[::-1])
+
+    def __iter__(self) ->Iterator[bool]:
+        return self.iter_msb0()
 
     def _copy(self) ->BitStore:
         """Always creates a copy, even if instance is immutable."""
-        new_bitstore = BitStore()
-        new_bitstore._bitarray = self._bitarray.copy()
-        new_bitstore.modified_length = self.modified_length
-        new_bitstore.immutable = False  # The copy is always mutable
-        return new_bitstore
+        if self.modified_length is None:
+            return BitStore.frombitarray(self._bitarray.copy())
+        # Slicing to the modified length already makes a new bitarray.
+        return BitStore.frombitarray(self._slice_bitarray(None, None))
+
+    def copy(self) ->BitStore:
+        """Return a copy, or the same instance if it is immutable as it can then be shared."""
+        return self if self.immutable else self._copy()
+
+    def tobytes(self) ->bytes:
+        if self.modified_length is not None:
+            return self._bitarray[:self.modified_length].tobytes()
+        return self._bitarray.tobytes()
+
+    def _slice_bitarray(self, start: Optional[int], end: Optional[int]) ->bitarray.bitarray:
+        if start is None and end is None and self.modified_length is None:
+            # The whole store can be converted without slicing a copy of it first.
+            return self._bitarray
+        return self.getslice(start, end)._bitarray
+
+    def slice_to_uint(self, start: Optional[int]=None, end: Optional[int]=None) ->int:
+        ba = self._slice_bitarray(start, end)
+        if not ba:
+            raise ValueError("Can't interpret an empty bitstring as an integer.")
+        # int.from_bytes is quicker than ba2int. The zero padding bits at the end of the bytes are shifted off.
+        return int.from_bytes(ba.tobytes(), 'big') >> (-len(ba) & 7)
+
+    def slice_to_int(self, start: Optional[int]=None, end: Optional[int]=None) ->int:
+        ba = self._slice_bitarray(start, end)
+        if not ba:
+            raise ValueError("Can't interpret an empty bitstring as an integer.")
+        return int.from_bytes(ba.tobytes(), 'big', signed=True) >> (-len(ba) & 7)
+
+    def slice_to_hex(self, start: Optional[int]=None, end: Optional[int]=None) ->str:
+        return bitarray.util.ba2hex(self._slice_bitarray(start, end))
+
+    def slice_to_bin(self, start: Optional[int]=None, end: Optional[int]=None) ->str:
+        return self._slice_bitarray(start, end).to01()
+
+    def tomemoryview(self) ->memoryview:
+        """Return a read-only view of the underlying bytes without copying them.
+
+        The bitarray can't be resized while the view exists, so it should be released after use.
+        Any bits beyond the store's length are included in the view.
+        """
+        return memoryview(self._bitarray).toreadonly()
+
+    def count(self, value: int, /) ->int:
+        if self.modified_length is None:
+            return self._bitarray.count(value)
+        # Only count up to the length, without slicing a copy of the bits.
+        return self._bitarray.count(value, 0, self.modified_length)
+
+    def any_set(self) ->bool:
+        if self.modified_length is None:
+            return self._bitarray.any()
+        # find stops at the first set bit, so this can return long before the end.
+        return self._bitarray.find(1, 0, self.modified_length) != -1
+
+    def all_set(self) ->bool:
+        if self.modified_length is None:
+            return self._bitarray.all()
+        return self._bitarray.find(0, 0, self.modified_length) == -1
+
+    def setall(self, value: int, /) ->None:
+        self._bitarray.setall(value)
+
+    def bytereverse(self) ->None:
+        self._bitarray.bytereverse()
+
+    def find_bit(self, value: int, start: int, /) ->int:
+        return self._bitarray.find(value, start)
+
+    def _find_bytes(self, bytes_: bytes, start: int, end: int, right: bool) ->int:
+        """Find bytes_ on a byte boundary between bit positions start and end with bytes.find or bytes.rfind.
+
+        Windows of the bytes are searched, doubling in size, so that an early match doesn't convert everything.
+        Neighbouring windows overlap by len(bytes_) - 1 so no match is missed.
+        """
+        start_byte = (start + 7) // 8
+        end_byte = end // 8
+        size = 4096
+        while True:
+            if right:
+                lo, hi = max(end_byte - size - len(bytes_) + 1, start_byte), end_byte
+                p = self._bitarray[lo * 8: hi * 8].tobytes().rfind(bytes_)
+            else:
+                lo, hi = start_byte, min(start_byte + size + len(bytes_) - 1, end_byte)
+                p = self._bitarray[lo * 8: hi * 8].tobytes().find(bytes_)
+            if p != -1:
+                return (lo + p) * 8
+            if hi - lo < size + len(bytes_) - 1:
+                # This window reached the end of the search range.
+                return -1
+            if right:
+                end_byte -= size
+            else:
+                start_byte += size
+            size *= 2
+
+    def _find_shifted(self, bs: BitStore, start: int, end: int, right: bool) ->int:
+        """Find bs at any bit position between start and end by searching for whole bytes with bytes.find or bytes.rfind.
+
+        Wherever bs starts, the bits of it that cover whole bytes of the store are one of eight byte strings,
+        so each of those is searched for and every hit is then checked against the whole of bs.
+        Windows of the bytes are searched, doubling in size, as in _find_bytes.
+        """
+        needle = bs._slice_bitarray(None, None)
+        m = len(needle)
+        key_length = (m - 7) // 8
+        # If bs starts j bits before a byte boundary then bits j onwards of it will be found as whole bytes.
+        keys = [(j, needle[j: j + key_length * 8].tobytes()) for j in range(8)]
+        start_byte = start // 8
+        end_byte = (end + 7) // 8
+        size = 4096
+        misses = 0
+        while True:
+            if right:
+                lo, hi = max(end_byte - size - key_length + 1, start_byte), end_byte
+            else:
+                lo, hi = start_byte, min(start_byte + size + key_length - 1, end_byte)
+            b = self._bitarray[lo * 8: hi * 8].tobytes()
+            best = -1
+            for j, key in keys:
+                p = b.rfind(key) if right else b.find(key)
+                while p != -1:
+                    pos = (lo + p) * 8 - j
+                    if best != -1 and (pos <= best if right else pos >= best):
+                        break
+                    if start <= pos and pos + m <= end and self._bitarray[pos: pos + m] == needle:
+                        best = pos
+                        break
+                    misses += 1
+                    if misses > 1000:
+                        # The data is too repetitive for the byte search to help, so let bitarray do it all.
+                        return self._bitarray.find(needle, start, end, right=right)
+                    p = b.rfind(key, 0, p + key_length - 1) if right else b.find(key, p + 1)
+            # Any match in a later window would be further from where the search started.
+            if best != -1:
+                return best
+            if hi - lo < size + key_length - 1:
+                # This window reached the end of the search range.
+                return -1
+            if right:
+                end_byte -= size
+            else:
+                start_byte += size
+            size *= 2
+
+    def find(self, bs: BitStore, start: int, end: int, bytealigned: bool=False) ->int:
+        if not bytealigned:
+            if len(bs) >= 32 and end - start >= 8192:
+                # A long pattern in lots of data is found much more quickly by bytes.find than bit by bit.
+                return self._find_shifted(bs, start, end, False)
+            return self._bitarray.find(bs._bitarray, start, end)
+        if len(bs) % 8 == 0:
+            # Whole bytes on whole byte boundaries, so bytes.find can do the search.
+            return self._find_bytes(bs.tobytes(), start, end, False)
+        return next(self.findall_msb0(bs, start, end, bytealigned), -1)
+
+    def rfind(self, bs: BitStore, start: int, end: int, bytealigned: bool=False) ->int:
+        if not bytealigned:
+            if len(bs) >= 32 and end - start >= 8192:
+                return self._find_shifted(bs, start, end, True)
+            return self._bitarray.find(bs._bitarray, start, end, right=True)
+        if len(bs) % 8 == 0:
+            return self._find_bytes(bs.tobytes(), start, end, True)
+        return next(self.rfindall_msb0(bs, start, end, bytealigned), -1)
+
+    def findall_msb0(self, bs: BitStore, start: int, end: int, bytealigned: bool=False) ->Iterator[int]:
+        if bytealigned is True and len(bs) % 8 == 0:
+            # Special case, looking for whole bytes on whole byte boundaries
+            bytes_ = bs.tobytes()
+            # Round up start byte to next byte, and round end byte down.
+            # We're only looking for whole bytes, so can ignore bits at either end.
+            start_byte = (start + 7) // 8
+            end_byte = end // 8
+            b = self._bitarray[start_byte * 8: end_byte * 8].tobytes()
+            byte_pos = 0
+            bytes_to_search = end_byte - start_byte
+            while byte_pos < bytes_to_search:
+                byte_pos = b.find(bytes_, byte_pos)
+                if byte_pos == -1:
+                    break
+                yield (byte_pos + start_byte) * 8
+                byte_pos = byte_pos + 1
+            return
+        if not bytealigned:
+            yield from self._bitarray.itersearch(bs._bitarray, start, end)
+            return
+        # After any match the next possible byte-aligned position is at the following byte boundary,
+        # so the search resumes from there instead of visiting every unaligned match in between.
+        pos = (start + 7) & ~7
+        while (p := self._bitarray.find(bs._bitarray, pos, end)) != -1:
+            if p % 8 == 0:
+                yield p
+            pos = (p // 8 + 1) * 8
+
+    def rfindall_msb0(self, bs: BitStore, start: int, end: int, bytealigned: bool=False) ->Iterator[int]:
+        if bytealigned is True and len(bs) % 8 == 0:
+            # Special case, looking for whole bytes on whole byte boundaries, so search the bytes from the end.
+            bytes_ = bs.tobytes()
+            start_byte = (start + 7) // 8
+            end_byte = end // 8
+            b = self._bitarray[start_byte * 8: end_byte * 8].tobytes()
+            # The next match must start before the previous one, so it ends at most one byte before its end.
+            byte_end = len(b)
+            while byte_end >= len(bytes_) and (byte_pos := b.rfind(bytes_, 0, byte_end)) != -1:
+                yield (byte_pos + start_byte) * 8
+                byte_end = byte_pos - 1 + len(bytes_)
+            return
+        if not bytealigned:
+            yield from self._bitarray.itersearch(bs._bitarray, start, end, right=True)
+            return
+        # Search back from the end, moving the end down so the next match can only start at an earlier byte boundary.
+        while (p := self._bitarray.find(bs._bitarray, start, end, right=True)) != -1:
+            if p % 8 == 0:
+                yield p
+            end = ((p - 1) & ~7) + len(bs)
+            if end - len(bs) < start:
+                return
+
+    def count_and(self, other: BitStore, /) ->int:
+        return bitarray.util.count_and(self._slice_bitarray(None, None), other._slice_bitarray(None, None))
+
+    def count_or(self, other: BitStore, /) ->int:
+        return bitarray.util.count_or(self._slice_bitarray(None, None), other._slice_bitarray(None, None))
+
+    def count_xor(self, other: BitStore, /) ->int:
+        return bitarray.util.count_xor(self._slice_bitarray(None, None), other._slice_bitarray(None, None))
+
+    def setitem_msb0(self, key: Union[int, slice], value: Union[int, BitStore], /) ->None:
+        if isinstance(value, BitStore):
+            self._bitarray.__setitem__(key, value._slice_bitarray(None, None))
+        else:
+            self._bitarray.__setitem__(key, value)
+
+    def setitem_lsb0(self, key: Union[int, slice], value: Union[int, BitStore], /) ->None:
+        if isinstance(key, slice):
+            new_slice = offset_slice_indices_lsb0(key, len(self))
+            self._bitarray.__setitem__(new_slice, value._slice_bitarray(None, None))
+        else:
+            self._bitarray.__setitem__(-key - 1, value)
+
+    def reverse(self) ->None:
+        if self.modified_length is None:
+            self._bitarray.reverse()
+            return
+        # Only the bits within the length are reversed.
+        ba = self._bitarray[:self.modified_length]
+        ba.reverse()
+        self._bitarray[:self.modified_length] = ba
+
+    def delitem_msb0(self, key: Union[int, slice], /) ->None:
+        self._bitarray.__delitem__(key)
+
+    def delitem_lsb0(self, key: Union[int, slice], /) ->None:
+        if isinstance(key, slice):
+            self._bitarray.__delitem__(offset_slice_indices_lsb0(key, len(self)))
+        else:
+            self._bitarray.__delitem__(-key - 1)
+
+    def invert_msb0(self, index: Optional[int]=None, /) ->None:
+        if index is not None:
+            self._bitarray.invert(index)
+        else:
+            self._bitarray.invert()
+
+    def invert_lsb0(self, index: Optional[int]=None, /) ->None:
+        if index is not None:
+            self._bitarray.invert(-index - 1)
+        else:
+            self._bitarray.invert()
+
+    def setitems_msb0(self, positions: Iterable[int], value: int, /) ->None:
+        """Set the bits at all the positions to value with a single bitarray sequence assignment."""
+        self._bitarray[list(positions)] = value
+
+    def setitems_lsb0(self, positions: Iterable[int], value: int, /) ->None:
+        self._bitarray[[-p - 1 for p in positions]] = value
+
+    def getitems_msb0(self, positions: Iterable[int], /) ->BitStore:
+        """Return the bits at all the positions, gathered with a single bitarray sequence index."""
+        if (s := range_as_slice(positions, len(self))) is not None:
+            # A stepped slice gathers the bits without making a list of the positions.
+            return BitStore.frombitarray(self._bitarray[s])
+        return BitStore.frombitarray(self._bitarray[list(positions)])
+
+    def getitems_lsb0(self, positions: Iterable[int], /) ->BitStore:
+        if type(positions) is range:
+            # Position p is at index length - 1 - p, so a range of positions is also a range of indices.
+            length = len(self)
+            indices = range(length - 1 - positions.start, length - 1 - positions.stop, -positions.step)
+            if (s := range_as_slice(indices, length)) is not None:
+                return BitStore.frombitarray(self._bitarray[s])
+        return BitStore.frombitarray(self._bitarray[[-p - 1 for p in positions]])
 
     def __getitem__(self, item: Union[int, slice], /) ->Union[int, BitStore]:
         if isinstance(item, int):
             return self.getindex(item)
         elif isinstance(item, slice):
-            new_bitstore = BitStore()
-            new_bitstore._bitarray = self._bitarray[item]
-            return new_bitstore
+            return BitStore.frombitarray(self._bitarray[item])
         else:
             raise TypeError("Invalid argument type.")
 
+    def _index_within_length(self, index: int, /) ->int:
+        """Return index as a non-negative bit index, checked against the modified length."""
+        length = self.modified_length
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('bitarray index out of range')
+        return index
+
+    def getindex_msb0(self, index: int, /) ->bool:
+        if self.modified_length is not None:
+            index = self._index_within_length(index)
+        return bool(self._bitarray.__getitem__(index))
+
+    def getslice_withstep_msb0(self, key: slice, /) ->BitStore:
+        if self.modified_length is not None:
+            key = slice(*key.indices(self.modified_length))
+        return BitStore.frombitarray(self._bitarray.__getitem__(key))
+
+    def getslice_withstep_lsb0(self, key: slice, /) ->BitStore:
+        key = offset_slice_indices_lsb0(key, len(self))
+        return BitStore.frombitarray(self._bitarray.__getitem__(key))
+
+    def getslice_msb0(self, start: Optional[int], stop: Optional[int], /) ->BitStore:
+        if self.modified_length is not None:
+            key = slice(*slice(start, stop, None).indices(self.modified_length))
+            start = key.start
+            stop = key.stop
+        return BitStore.frombitarray(self._bitarray[start:stop])
+
+    def getslice_lsb0(self, start: Optional[int], stop: Optional[int], /) ->BitStore:
+        start, stop = offset_start_stop_lsb0(start, stop, len(self))
+        return BitStore.frombitarray(self._bitarray[start:stop])
+
+    def getindex_lsb0(self, index: int, /) ->bool:
+        if self.modified_length is not None:
+            return bool(self._bitarray.__getitem__(self.modified_length - 1 - self._index_within_length(index)))
+        return bool(self._bitarray.__getitem__(-index - 1))
+
     def getindex(self, i: int) ->int:
         """Get the bit at index i (LSB0 order)."""
+        length = len(self)
         if i < 0:
-            i += len(self)
-        if i < 0 or i >= len(self):
+            i += length
+        if i < 0 or i >= length:
             raise IndexError("Bit index out of range")
-        return self._bitarray[len(self) - 1 - i]
+        return self._bitarray[length - 1 - i]
 
     def __len__(self) ->int:
-        return (self.modified_length if self.modified_length is not None else
-            len(self._bitarray))
+        ml = self.modified_length
+        return len(self._bitarray) if ml is None else ml
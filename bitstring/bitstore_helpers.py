@@ -1,6 +1,7 @@
 from __future__ import annotations
 import struct
 import math
+import string
 import functools
 from typing import Union, Optional, Dict, Callable
 import bitarray
@@ -10,13 +11,153 @@ from bitstring.fp8 import p4binary_fmt, p3binary_fmt
 from bitstring.mxfp import e3m2mxfp_fmt, e2m3mxfp_fmt, e2m1mxfp_fmt, e4m3mxfp_saturate_fmt, e5m2mxfp_saturate_fmt, e4m3mxfp_overflow_fmt, e5m2mxfp_overflow_fmt
 CACHE_SIZE = 256
 
+# Translation table that removes whitespace and underscores and lowercases letters, all in one pass.
+_TIDY_TABLE = str.maketrans({**{c: None for c in ' \t\n\r\v\f\x1c\x1d\x1e\x1f_'},
+                             **{c: c.lower() for c in string.ascii_uppercase}})
+
 
 def tidy_input_string(s: str) -> str:
     """Return string made lowercase and with all whitespace and underscores removed."""
-    return ''.join(char.lower() for char in s if char not in (' ', '\t', '\n', '\r', '_'))
+    try:
+        if s.isascii():
+            return s.translate(_TIDY_TABLE)
+        # The table only covers ASCII whitespace, so other strings are split on any whitespace instead.
+        return ''.join(s.split()).lower().replace('_', '')
+    except (AttributeError, TypeError):
+        raise ValueError(f"Expected str object but received a {type(s)} with value {s}.")
+
+
+@functools.lru_cache(CACHE_SIZE)
+def str_to_bitstore(s: str) -> BitStore:
+    literal_func = literal_bit_funcs.get(s[:2])
+    if literal_func is not None and s[2:].strip() and ',' not in s and '*' not in s:
+        # A single hex, bin or oct literal doesn't need to go through the token parser.
+        # A prefix followed by nothing but whitespace is left for the token parser to reject.
+        bs = literal_func(s)
+    else:
+        _, tokens = bitstring.utils.tokenparser(s)
+        bs = BitStore()
+        for token in tokens:
+            bs += bitstore_from_token(*token)
+    bs.immutable = True
+    return bs
+
+
+def bin2bitstore(binstring: str) -> BitStore:
+    binstring = tidy_input_string(binstring)
+    binstring = binstring.replace('0b', '')
+    try:
+        return BitStore(binstring)
+    except ValueError:
+        raise bitstring.CreationError(f"Invalid character in bin initialiser {binstring}.")
+
+
+def bin2bitstore_unsafe(binstring: str) -> BitStore:
+    return BitStore(binstring)
+
+
+def hex2bitstore(hexstring: str) -> BitStore:
+    hexstring = tidy_input_string(hexstring)
+    hexstring = hexstring.replace('0x', '')
+    try:
+        ba = bitarray.util.hex2ba(hexstring)
+    except ValueError:
+        raise bitstring.CreationError("Invalid symbol in hex initialiser.")
+    return BitStore.frombitarray(ba)
+
+
+def oct2bitstore(octstring: str) -> BitStore:
+    octstring = tidy_input_string(octstring)
+    octstring = octstring.replace('0o', '')
+    try:
+        ba = bitarray.util.base2ba(8, octstring)
+    except ValueError:
+        raise bitstring.CreationError("Invalid symbol in oct initialiser.")
+    return BitStore.frombitarray(ba)
+
+
+def int2bitstore(i: int, length: int, signed: bool) -> BitStore:
+    i = int(i)
+    if signed:
+        if i >= (1 << (length - 1)) or i < -(1 << (length - 1)):
+            raise bitstring.CreationError(f"{i} is too large a signed integer for a bitstring of length {length}. "
+                                          f"The allowed range is [{-(1 << (length - 1))}, {(1 << (length - 1)) - 1}].")
+        # Two's complement
+        i &= (1 << length) - 1
+    else:
+        if i >= (1 << length):
+            raise bitstring.CreationError(f"{i} is too large an unsigned integer for a bitstring of length {length}. "
+                                          f"The allowed range is [0, {(1 << length) - 1}].")
+        if i < 0:
+            raise bitstring.CreationError("uint cannot be initialised with a negative number.")
+    # Convert whole bytes with int.to_bytes, with the value shifted up so that the padding is at the end.
+    padding = -length & 7
+    ba = bitarray.bitarray()
+    ba.frombytes((i << padding).to_bytes((length + 7) // 8, 'big'))
+    del ba[length:]
+    return BitStore.frombitarray(ba)
+
+
+def intle2bitstore(i: int, length: int, signed: bool) -> BitStore:
+    x = int2bitstore(i, length, signed).tobytes()
+    return BitStore.frombytes(x[::-1])
+
+
+def ue2bitstore(i: Union[str, int]) -> BitStore:
+    i = int(i)
+    if i < 0:
+        raise bitstring.CreationError("Cannot use negative initialiser for unsigned exponential-Golomb.")
+    # The code is i + 1 written as an unsigned int preceded by one fewer zero bits than its bit length.
+    leadingzeros = (i + 1).bit_length() - 1
+    return int2bitstore(i + 1, 2 * leadingzeros + 1, False)
+
+
+def se2bitstore(i: Union[str, int]) -> BitStore:
+    i = int(i)
+    if i > 0:
+        u = (i * 2) - 1
+    else:
+        u = -2 * i
+    return ue2bitstore(u)
+
+
+def _uie_binstring(i: int) -> str:
+    # A 0 precedes each bit of i + 1 after its leading 1, and a 1 terminates the code.
+    return '1' if i == 0 else '0' + '0'.join(bin(i + 1)[3:]) + '1'
+
+
+def uie2bitstore(i: Union[str, int]) -> BitStore:
+    i = int(i)
+    if i < 0:
+        raise bitstring.CreationError("Cannot use negative initialiser for unsigned interleaved exponential-Golomb.")
+    return BitStore(_uie_binstring(i))
+
+
+def sie2bitstore(i: Union[str, int]) -> BitStore:
+    i = int(i)
+    if i == 0:
+        return BitStore('1')
+    # The sign bit is added to the string so that only one BitStore is made.
+    return BitStore(_uie_binstring(abs(i)) + ('1' if i < 0 else '0'))
 
 
 e8m0mxfp_allowed_values = [float(2 ** x) for x in range(-127, 128)]
 literal_bit_funcs: Dict[str, Callable[..., BitStore]] = {'0x': hex2bitstore,
     '0X': hex2bitstore, '0b': bin2bitstore, '0B': bin2bitstore, '0o':
     oct2bitstore, '0O': oct2bitstore}
+
+
+def bitstore_from_token(name: str, token_length: Optional[int], value: Optional[str]) -> BitStore:
+    if (literal_func := literal_bit_funcs.get(name)) is not None:
+        return literal_func(value)
+    try:
+        d = bitstring.dtypes.Dtype(name, token_length)
+    except ValueError as e:
+        raise bitstring.CreationError(f"Can't parse token: {e}")
+    if value is None and name != 'pad':
+        raise ValueError(f"Token {name} requires a value.")
+    bs = d.build(value)._bitstore
+    if token_length is not None and len(bs) != d.bitlength:
+        raise bitstring.CreationError(f"Token with length {token_length} packed with value of length {len(bs)} "
+                                      f"({name}:{token_length}={value}).")
+    return bs
@@ -1,10 +1,12 @@
 from __future__ import annotations
 import bitstring
-from bitstring.bits import Bits, BitsType
+from bitstring.bits import Bits, BitsType, _bitstore_readers, _in_place_readers
 from bitstring.dtypes import Dtype
+from bitstring import utils
 from typing import Union, List, Any, Optional, overload, TypeVar, Tuple
 import copy
 import numbers
+import struct
 TConstBitStream = TypeVar('TConstBitStream', bound='ConstBitStream')
 
 
@@ -115,9 +117,9 @@ class ConstBitStream(Bits):
 
     def _getbytepos(self) ->int:
         """Return the current position in the stream in bytes. Must be byte aligned."""
-        if self._pos % 8:
-            raise ValueError("Current position is not byte aligned")
-        return self._pos // 8
+        if self._pos & 7:
+            raise bitstring.ByteAlignError("Not byte aligned when using bytepos property.")
+        return self._pos >> 3
 
     def _setbitpos(self, pos: int) ->None:
         """Move to absolute position bit in bitstream."""
@@ -211,18 +213,18 @@ class ConstBitStream(Bits):
         Raises ValueError if pos < 0 or pos > len(self).
 
         """
+        bs = Bits._create_from_bitstype(bs)
+        if len(bs) == 0:
+            return
         if pos is None:
             pos = self._pos
+        if pos < 0:
+            pos += len(self)
         if pos < 0 or pos > len(self):
-            raise ValueError("pos must be between 0 and len(self)")
-        
-        bs = Bits(bs)
-        end = pos + len(bs)
-        if end > len(self):
-            self._bitstore.append(bs._bitstore)
-        else:
-            self._bitstore[pos:end] = bs._bitstore
-        self._pos = end
+            raise ValueError("Overwrite starts outside boundary of bitstring.")
+        # The slice assignment is done in place, and extends the bitstring if bs goes past its end.
+        self._overwrite(bs, pos)
+        self._pos = pos + len(bs)
 
     def find(self, bs: BitsType, /, start: Optional[int]=None, end:
         Optional[int]=None, bytealigned: Optional[bool]=None) ->Union[Tuple
@@ -247,24 +249,10 @@ class ConstBitStream(Bits):
         (6,)
 
         """
-        bs = Bits(bs)
-        if not bs:
-            raise ValueError("Cannot find an empty bitstring")
-        
-        start = 0 if start is None else start
-        end = len(self) if end is None else end
-        
-        if start < 0 or end > len(self) or end < start:
-            raise ValueError("Invalid start or end values")
-        
-        if bytealigned:
-            start = (start + 7) // 8 * 8
-        
-        pos = self._bitstore.find(bs._bitstore, start, end, bytealigned)
-        if pos >= 0:
-            self._pos = pos
-            return (pos,)
-        return ()
+        p = super().find(bs, start, end, bytealigned)
+        if p:
+            self._pos = p[0]
+        return p
 
     def rfind(self, bs: BitsType, /, start: Optional[int]=None, end:
         Optional[int]=None, bytealigned: Optional[bool]=None) ->Union[Tuple
@@ -286,24 +274,10 @@ class ConstBitStream(Bits):
         if end < start.
 
         """
-        bs = Bits(bs)
-        if not bs:
-            raise ValueError("Cannot find an empty bitstring")
-        
-        start = 0 if start is None else start
-        end = len(self) if end is None else end
-        
-        if start < 0 or end > len(self) or end < start:
-            raise ValueError("Invalid start or end values")
-        
-        if bytealigned:
-            start = (start + 7) // 8 * 8
-        
-        pos = self._bitstore.rfind(bs._bitstore, start, end, bytealigned)
-        if pos >= 0:
-            self._pos = pos
-            return (pos,)
-        return ()
+        p = super().rfind(bs, start, end, bytealigned)
+        if p:
+            self._pos = p[0]
+        return p
 
     def read(self, fmt: Union[int, str, Dtype]) ->Union[int, float, str,
         Bits, bool, bytes, None]:
@@ -342,19 +316,52 @@ class ConstBitStream(Bits):
         Raises ValueError if the format is not understood.
 
         """
-        if isinstance(fmt, int):
-            fmt = f'bits:{fmt}'
-        
+        p = self._pos
+        if isinstance(fmt, numbers.Integral):
+            if fmt < 0:
+                raise ValueError("Cannot read negative amount.")
+            available = len(self) - p
+            if fmt > available:
+                raise bitstring.ReadError(f"Cannot read {fmt} bits, only {available} available.")
+            self._pos = p + fmt
+            return self._slice(p, p + fmt)
+        # Dtype caches the parsing of string tokens, so reading with the same format again doesn't reparse it.
         dtype = Dtype(fmt)
-        length = dtype.length
-        
-        if self._pos + length > len(self):
-            raise bitstring.ReadError("Not enough bits available")
-        
-        value = dtype.get_fn(self[self._pos:self._pos + length])
-        self._pos += length
-        
-        return value
+        bitlength = dtype.bitlength
+        if bitlength and dtype.scale is None and not bitstring.options.lsb0:
+            # Common fixed length tokens such as 'uint:8' or 'bool' are read straight from the bitstore,
+            # and whole-byte ints and floats on a byte boundary are unpacked from its buffer.
+            code = None if p & 7 else utils.DTYPE_STRUCT_FORMATS.get((dtype.name, bitlength))
+            reader = _bitstore_readers.get(dtype.name)
+            if code is not None or reader is not None:
+                if p + bitlength > len(self):
+                    raise bitstring.ReadError(f"Needed a length of at least {bitlength} bits, but only "
+                                              f"{len(self) - p} bits were available.")
+                self._pos = p + bitlength
+                if code is not None:
+                    return struct.unpack_from(code[0] + code[1], self._bitstore.tomemoryview(), p >> 3)[0]
+                return reader(self._bitstore, p, p + bitlength)
+        if dtype.bitlength is None and not dtype.variable_length:
+            # No length specified? Try again, but read to end.
+            bitlength = len(self) - self._pos
+            items, remainder = divmod(bitlength, dtype.bits_per_item)
+            if remainder != 0:
+                raise ValueError(
+                    f"The '{dtype.name}' type must have a bit length that is a multiple of {dtype.bits_per_item}"
+                    f" so cannot be read from the {bitlength} bits that are available.")
+            dtype = Dtype(fmt, items)
+        if dtype.bitlength is not None:
+            val = dtype.read_fn(self, self._pos)
+            self._pos += dtype.bitlength
+        elif dtype.scale is None and (in_place_reader := _in_place_readers.get(dtype.name)) is not None:
+            val, self._pos = in_place_reader(self, self._pos)
+        else:
+            val, self._pos = dtype.read_fn(self, self._pos)
+
+        if self._pos > len(self):
+            self._pos = p
+            raise bitstring.ReadError(f"Reading off end of bitstring with fmt '{fmt}'. Only {len(self) - p} bits available.")
+        return val
 
     def readlist(self, fmt: Union[str, List[Union[int, str, Dtype]]], **kwargs
         ) ->List[Union[int, float, str, Bits, bool, bytes, None]]:
@@ -378,23 +385,9 @@ class ConstBitStream(Bits):
         >>> i, bs1, bs2 = s.readlist(['uint:12', 10, 10])
 
         """
-        tokens = []
-        if isinstance(fmt, str):
-            fmt = fmt.replace(' ', '')
-            tokens = fmt.split(',')
-        elif isinstance(fmt, list):
-            tokens = fmt
-        else:
-            raise ValueError("fmt must be either a string or a list")
-
-        return_values = []
-        for token in tokens:
-            if isinstance(token, int):
-                token = f'bits:{token}'
-            value = self.read(token)
-            if not token.startswith('pad:'):
-                return_values.append(value)
-        return return_values
+        # _readlist compiles each format string to its Dtypes once and caches them.
+        value, self._pos = self._readlist(fmt, self._pos, **kwargs)
+        return value
 
     def readto(self: TConstBitStream, bs: BitsType, /, bytealigned:
         Optional[bool]=None) ->TConstBitStream:
@@ -460,7 +453,8 @@ class ConstBitStream(Bits):
         See the docstring for 'read' for token examples.
 
         """
-        pass
+        value, _ = self._readlist(fmt, self._pos, **kwargs)
+        return value
 
     def bytealign(self) ->int:
         """Align to next byte and return number of skipped bits.
@@ -469,7 +463,10 @@ class ConstBitStream(Bits):
         aligning to the next byte.
 
         """
-        pass
+        # The number of bits up to the next multiple of 8, which is zero if already aligned.
+        skipped = -self._pos & 7
+        self.pos += skipped
+        return skipped
 
     @overload
     def __getitem__(self: TBits, key: slice, /) ->TBits:
@@ -482,7 +479,9 @@ class ConstBitStream(Bits):
     def __getitem__(self: TBits, key: Union[slice, int], /) ->Union[TBits, bool
         ]:
         """Return a new bitstring representing a slice of the current bitstring."""
-        if isinstance(key, numbers.Integral):
+        if type(key) is int:
+            return bool(self._bitstore.getindex(key))
+        if type(key) is not slice and isinstance(key, numbers.Integral):
             return bool(self._bitstore.getindex(key))
         bs = super().__new__(self.__class__)
         bs._bitstore = self._bitstore.getslice_withstep(key)
@@ -632,9 +631,9 @@ class BitStream(ConstBitStream, bitstring.BitArray):
         bs -- The bitstring to prepend.
 
         """
-        bs = Bits(bs)
-        self._bitstore = bs._bitstore + self._bitstore
-        self._pos += len(bs)
+        bs = Bits._create_from_bitstype(bs)
+        super().prepend(bs)
+        self._pos = 0
 
     def __setitem__(self, /, key: Union[slice, int], value: BitsType) ->None:
         length_before = len(self)
@@ -667,13 +666,19 @@ class BitStream(ConstBitStream, bitstring.BitArray):
         Raises ValueError if pos < 0 or pos > len(self).
 
         """
+        bs = Bits._create_from_bitstype(bs)
+        if len(bs) == 0:
+            return
+        if bs is self:
+            bs = self._copy()
         if pos is None:
             pos = self._pos
-        if pos < 0 or pos > len(self):
-            raise ValueError("pos must be between 0 and len(self)")
-        
-        bs = Bits(bs)
-        self._bitstore = self._bitstore[:pos] + bs._bitstore + self._bitstore[pos:]
+        if pos < 0:
+            pos += len(self)
+        if not 0 <= pos <= len(self):
+            raise ValueError("Invalid insert position.")
+        # Splice into the existing bitarray rather than building a new one from slices.
+        self._insert(bs, pos)
         self._pos = pos + len(bs)
 
     def replace(self, old: BitsType, new: BitsType, start: Optional[int]=
@@ -698,29 +703,8 @@ class BitStream(ConstBitStream, bitstring.BitArray):
         out of range.
 
         """
-        old = Bits(old)
-        new = Bits(new)
-        if not old:
-            raise ValueError("Cannot replace an empty bitstring")
-        
-        start = 0 if start is None else start
-        end = len(self) if end is None else end
-        count = -1 if count is None else count
-        
-        if start < 0 or end > len(self) or start > end:
-            raise ValueError("Invalid start or end values")
-        
-        replacements = 0
-        pos = start
-        while count != 0:
-            found = self.find(old, start=pos, end=end, bytealigned=bytealigned)
-            if not found:
-                break
-            pos = found[0]
-            self._bitstore = self._bitstore[:pos] + new._bitstore + self._bitstore[pos + len(old):]
-            pos += len(new)
-            end += len(new) - len(old)
-            replacements += 1
-            count -= 1
-        
-        return replacements
+        length_before = len(self)
+        replacement_count = super().replace(old, new, start, end, count, bytealigned)
+        if len(self) != length_before:
+            self._pos = 0
+        return replacement_count
@@ -96,6 +96,14 @@ class Dtype:
         """A function to read the value of the data type."""
         return self._read_fn
 
+    @classmethod
+    @functools.lru_cache(CACHE_SIZE)
+    def _new_from_token(cls, token: str, scale: Union[None, float, int]=None
+        ) ->Dtype:
+        # Dtypes are immutable, so the same instance can be returned every time a token is used.
+        token = ''.join(token.split())
+        return dtype_register.get_dtype(*utils.parse_name_length_token(token), scale=scale)
+
     def __hash__(self) ->int:
         return hash((self._name, self._length))
 
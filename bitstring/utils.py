@@ -32,6 +32,22 @@ REPLACEMENTS_NE: Dict[str, str] = {'b': 'int8', 'B': 'uint8', 'h':
     'floatne64'}
 PACK_CODE_SIZE: Dict[str, int] = {'b': 1, 'B': 1, 'h': 2, 'H': 2, 'l': 4,
     'L': 4, 'q': 8, 'Q': 8, 'e': 2, 'f': 4, 'd': 8}
+# The struct endianness and format code for each (dtype name, length) that can be unpacked in bulk.
+DTYPE_STRUCT_FORMATS: Dict[Tuple[str, int], Tuple[str, str]] = {
+    ('uint', 8): ('>', 'B'), ('uintbe', 8): ('>', 'B'), ('uintle', 8): ('<', 'B'),
+    ('int', 8): ('>', 'b'), ('intbe', 8): ('>', 'b'), ('intle', 8): ('<', 'b'),
+    ('uint', 16): ('>', 'H'), ('uintbe', 16): ('>', 'H'), ('uintle', 16): ('<', 'H'),
+    ('int', 16): ('>', 'h'), ('intbe', 16): ('>', 'h'), ('intle', 16): ('<', 'h'),
+    ('uint', 32): ('>', 'L'), ('uintbe', 32): ('>', 'L'), ('uintle', 32): ('<', 'L'),
+    ('int', 32): ('>', 'l'), ('intbe', 32): ('>', 'l'), ('intle', 32): ('<', 'l'),
+    ('uint', 64): ('>', 'Q'), ('uintbe', 64): ('>', 'Q'), ('uintle', 64): ('<', 'Q'),
+    ('int', 64): ('>', 'q'), ('intbe', 64): ('>', 'q'), ('intle', 64): ('<', 'q'),
+    ('float', 16): ('>', 'e'), ('floatle', 16): ('<', 'e'),
+    ('float', 32): ('>', 'f'), ('floatle', 32): ('<', 'f'),
+    ('float', 64): ('>', 'd'), ('floatle', 64): ('<', 'd'),
+}
+# The struct endianness for bfloat dtypes, which are unpacked in bulk as the top half of a 32-bit float.
+BFLOAT_STRUCT_ENDIANNESS: Dict[str, str] = {'bfloat': '>', 'bfloatle': '<'}
 
 
 def structparser(m: Match[str]) ->List[str]:
@@ -59,6 +75,42 @@ def structparser(m: Match[str]) ->List[str]:
     return tokens
 
 
+@functools.lru_cache(CACHE_SIZE)
+def parse_name_length_token(fmt: str, **kwargs) ->Tuple[str, Optional[int]]:
+    """Parse a single 'name[:]length' token, taking the length from kwargs if it's a keyword."""
+    if (m := NAME_INT_RE.match(fmt)):
+        name = m.group(1)
+        length_str = m.group(2)
+        length = None if length_str == '' else int(length_str)
+    elif (m := NAME_KWARG_RE.match(fmt)):
+        name = m.group(1)
+        try:
+            length_str = kwargs[m.group(2)]
+        except KeyError:
+            raise ValueError(f"Can't parse 'name[:]length' token '{fmt}'.")
+        length = int(length_str)
+    else:
+        raise ValueError(f"Can't parse 'name[:]length' token '{fmt}'.")
+    return name, length
+
+
+@functools.lru_cache(CACHE_SIZE)
+def preprocess_tokens(fmt: str) ->List[str]:
+    """Remove whitespace, expand brackets, factors and struct codes and return the single tokens."""
+    fmt = expand_brackets(''.join(fmt.split()))
+    final_tokens = []
+    for meta_token in fmt.split(','):
+        if meta_token == '':
+            continue
+        factor = 1
+        if (m := MULTIPLICATIVE_RE.match(meta_token)):
+            factor = int(m.group('factor'))
+            meta_token = m.group('token')
+        tokens = structparser(m) if (m := STRUCT_PACK_RE.match(meta_token)) else [meta_token]
+        final_tokens.extend(tokens * factor)
+    return final_tokens
+
+
 @functools.lru_cache(CACHE_SIZE)
 def tokenparser(fmt: str, keys: Tuple[str, ...]=()) ->Tuple[bool, List[
     Tuple[str, Union[int, str, None], Optional[str]]]]:
@@ -129,6 +129,15 @@ class TestCreation:
         a = Array('u8', m)
         assert a.tolist() == [ord('3'), ord('4'), ord('5')]
 
+    def test_creation_copies_bitarray(self):
+        b = BitArray('0x0102')
+        a = Array('u8', b)
+        a[0] = 9
+        assert b == '0x0102'
+        a = Array('u8', bytearray(b'\x01\x02'), trailing_bits='0b1')
+        assert a.tolist() == [1, 2]
+        assert a.trailing_bits == '0b1'
+
     def test_creation_from_bits(self):
         a = bitstring.pack('20*i19', *range(-10, 10))
         b = Array('i19', a)
@@ -148,6 +157,17 @@ class TestCreation:
             a = Array('uint8', f)
             assert a[0:4].tobytes() == b'\x00\x00\x01\xb3'
 
+    def test_struct_dtype_over_file_data(self):
+        filename = os.path.join(THIS_DIR, 'test.m1v')
+        a = Array('>H')
+        a.data = Bits(filename=filename, length=40)
+        assert a.tolist() == [0x0000, 0x01b3]
+        assert list(a) == a.tolist()
+        a = Array('<H', [1, 2, 3])
+        for x in a:
+            a.append(x)
+        assert a.tolist() == [1, 2, 3, 1, 2, 3]
+
     def test_different_type_codes(self):
         a = Array('>H', [10, 20])
         assert a.data.unpack('2*uint16') == a.tolist()
@@ -188,6 +208,91 @@ class TestArrayMethods:
         a.dtype = 'p3binary'
         assert a.count(float('nan')) == 2
 
+    def test_count_non_numeric(self):
+        a = Array('hex8', ['41', '42', '41'])
+        assert a.count('41') == 2
+        b = Array('u9', [1, 2, 3])
+        assert b.count(float('nan')) == 0
+
+    def test_struct_dtypes_match_element_reads(self):
+        data = BitArray('0x0123456789abcdef1032547698badcfe, 0b101')
+        for fmt in ['u8', 'i8', '>H', '<h', 'uintle32', 'intbe32', '<q', 'float16', 'floatle32', '>d']:
+            a = Array(fmt)
+            a.data = data
+            items = [a[i] for i in range(len(a))]
+            assert list(a) == items
+            assert a.tolist() == items
+            assert a.count(items[0]) == items.count(items[0])
+        a = Array('floatle32', [1.0, float('nan'), 2.0, float('nan')])
+        assert a.count(float('nan')) == 2
+        assert a.count(2) == 1
+
+    def test_struct_dtypes_with_lsb0(self):
+        a = Array('>H', [1, 2, 3])
+        b = Array('u12', [0x001, 0x002, 0x003, 0x004])
+        bitstring.lsb0 = True
+        try:
+            assert a.tolist() == [a[i] for i in range(3)]
+            assert list(b) == b.tolist()
+        finally:
+            bitstring.lsb0 = False
+
+    def test_struct_dtypes_read_like_slices(self):
+        for lsb0 in (False, True):
+            bitstring.lsb0 = lsb0
+            try:
+                a = Array('<h', [1, -2, 300])
+                assert a.tolist() == [a.data[i * 16:(i + 1) * 16].intle for i in range(3)]
+                assert a[-1] == a.data[32:48].intle
+                assert a.pop(0) == 1
+            finally:
+                bitstring.lsb0 = False
+
+    def test_bfloat_bulk_conversion(self):
+        values = [0.0, -1.5, 3.140625, 1e30, float('inf'), 1e39, 2]
+        for dtype in ['bfloat', 'bfloatle']:
+            a = Array(dtype, values)
+            d = Dtype(dtype)
+            expected = [d.parse(d.build(v)) for v in values]
+            assert a.tolist() == expected
+            assert list(a) == expected
+            assert a.data == Bits().join(d.build(v) for v in values)
+        a = Array('bfloat', [1, 2], trailing_bits='0b1')
+        assert a.tolist() == [1.0, 2.0]
+
+    def test_struct_dtypes_packing(self):
+        a = Array('<H', [1, 2, 3, 4])
+        a[1:3] = (x for x in [10, 20, 30])
+        assert a.tolist() == [1, 10, 20, 30, 4]
+        a.extend([5, True])
+        assert a.tolist() == [1, 10, 20, 30, 4, 5, 1]
+        assert a.data == Array('uintle16', [1, 10, 20, 30, 4, 5, 1]).data
+        with pytest.raises(ValueError):
+            a[0:1] = [-1]
+        with pytest.raises(ValueError):
+            a.extend([65536])
+        assert len(a) == 7
+        b = Array('float16', [1, 2.5])
+        b.extend([1e10, '0.5'])
+        assert b.tolist() == [1.0, 2.5, float('inf'), 0.5]
+
+    def test_struct_dtypes_indexing(self):
+        a = Array('<H', [1, 2, 3], trailing_bits='0b1')
+        assert a[1] == 2
+        assert a[-1] == 3
+        a[1] = 500
+        assert a.tolist() == [1, 500, 3]
+        assert a.trailing_bits == '0b1'
+        with pytest.raises(ValueError):
+            a[0] = 65536
+        with pytest.raises(IndexError):
+            _ = a[3]
+        b = Array('float16', [0.0])
+        b[0] = 1e10
+        assert b[0] == float('inf')
+        b[0] = '2.5'
+        assert b[0] == 2.5
+
     def test_from_bytes(self):
         a = Array('i16')
         assert len(a) == 0
@@ -228,6 +333,25 @@ class TestArrayMethods:
         assert not c.equals('hello')
         assert not c.equals(array.array('B', [1, 3]))
 
+    def test_equals_array_array(self):
+        a = Array('=h', [-1, 0, 300])
+        assert a.equals(array.array('h', [-1, 0, 300]))
+        assert not a.equals(array.array('h', [-1, 0, 301]))
+        assert not a.equals(array.array('H', [65535, 0, 300]))
+        assert Array('u8', [1, 2]).equals(array.array('B', [1, 2]))
+        b = Array('=d', [0.0, float('nan')])
+        assert not b.equals(array.array('d', [0.0, float('nan')]))
+        assert Array('=d', [-0.0]).equals(array.array('d', [0.0]))
+
+    def test_equals_array_array_lsb0(self):
+        bitstring.lsb0 = True
+        try:
+            assert Array('u8', [1, 2, 3]).equals(array.array('B', [1, 2, 3]))
+            assert Array('=h', [-1, 0, 300]).equals(array.array('h', [-1, 0, 300]))
+            assert not Array('u8', [1, 2, 3]).equals(array.array('B', [1, 2, 4]))
+        finally:
+            bitstring.lsb0 = False
+
     def test_equals_with_trailing_bits(self):
         a = Array('hex4', ['a', 'b', 'c', 'd', 'e', 'f'])
         c = Array('hex4')
@@ -336,6 +460,26 @@ class TestArrayMethods:
         a.insert(1, '111')
         assert a.tolist() == ['000', '111', 'abc', '111', 'def']
 
+    def test_insert_many(self):
+        a = Array('u8', [1, 2, 6])
+        a.insert_many(2, [3, 4, 5])
+        assert a.tolist() == [1, 2, 3, 4, 5, 6]
+        a.insert_many(-6, (x for x in [0]))
+        a.insert_many(len(a), [])
+        assert a.tolist() == [0, 1, 2, 3, 4, 5, 6]
+        b = Array('i5', [1, 4])
+        b.data += '0b11'
+        b.insert_many(1, [2, 3])
+        assert b.tolist() == [1, 2, 3, 4]
+        assert b.trailing_bits == '0b11'
+        with pytest.raises(IndexError):
+            b.insert_many(5, [1])
+        with pytest.raises(ValueError):
+            b.insert_many(0, [1, 100])
+        assert b.tolist() == [1, 2, 3, 4]
+        with pytest.raises(TypeError):
+            Array('hex4').insert_many(0, 'abc')
+
         with pytest.raises(ValueError):
             a.insert(2, 'hello')
         with pytest.raises(ValueError):
@@ -395,6 +539,14 @@ class TestArrayMethods:
         a.byteswap()
         assert a.tolist() == [0.25, 104, -6]
 
+    def test_byteswap_item_sizes(self):
+        for fmt in ['uint8', 'uint16', 'uint24', 'uint32', 'uint48', 'uint64']:
+            a = Array(fmt, [1, 2, 3], trailing_bits='0b101')
+            a.byteswap()
+            le = 'uintle' + fmt[4:] if fmt != 'uint8' else fmt
+            assert Array(le, a.data).tolist() == [1, 2, 3]
+            assert a.trailing_bits == '0b101'
+
     def test_to_file(self):
         filename = os.path.join(THIS_DIR, 'temp_bitstring_unit_testing_file')
         a = Array('uint5', [0, 1, 2, 3, 4, 5])
@@ -448,6 +600,30 @@ class TestArrayMethods:
         del a[3:1:-1]
         assert a.tolist() == [1, 2, 5, 6]
 
+    def test_getting_stepped_slices(self):
+        for dtype in ['u8', '>H', '<l', 'f64', 'i24', 'u5']:
+            a = Array(dtype, bytes(range(120)), trailing_bits='0b1')
+            items = a.tolist()
+            for key in [slice(None, None, 2), slice(None, None, -1), slice(3, -2, 3), slice(-1, 2, -4), slice(5, 5, 2)]:
+                b = a[key]
+                assert b.dtype == a.dtype
+                assert b.data == Bits().join(a.data[i * a.itemsize:(i + 1) * a.itemsize] for i in range(len(a))[key])
+                assert not b.trailing_bits
+                if dtype != 'f64':
+                    assert b.tolist() == items[key]
+
+    def test_deleting_stepped_slices(self):
+        for key in [slice(None, None, 3), slice(1, None, 2), slice(None, None, -2), slice(7, 0, -3), slice(5, 2, 1),
+                    slice(0, 20, 4)]:
+            items = list(range(10))
+            a = Array('i7', items, trailing_bits='0b10')
+            data = a.data
+            del a[key]
+            del items[key]
+            assert a.tolist() == items
+            assert a.trailing_bits == '0b10'
+            assert a.data is data
+
 
     def test_repr(self):
         a = Array('int5')
@@ -593,6 +769,19 @@ class TestArrayOperations:
         with pytest.raises(ValueError):
             _ = a - 4
 
+    def test_op_errors_are_collected(self):
+        a = Array('uint8', [100, 200, 250])
+        assert (a + 5).tolist() == [105, 205, 255]
+        with pytest.raises(ValueError, match="caused 2 errors. First error at index 1"):
+            _ = a + 60
+        with pytest.raises(ValueError, match="caused 3 errors. First error at index 0"):
+            a //= 0
+        assert a.tolist() == [100, 200, 250]
+        with pytest.raises(ValueError, match="Applying operator 'lshift' to Array caused 2 errors. First error at index 0"):
+            _ = Array('u8', [1, 2]) << -1
+        b = Array('<l', [1, -2])
+        assert (b * Array('<h', [3, 4])).tolist() == [3, -8]
+
     def test_in_place_sub(self):
         a = Array('float16', [-9, -10.5])
         a -= -1.5
@@ -684,6 +873,15 @@ class TestArrayOperations:
     def test_in_place_xor(self):
         a = Array('u10', [0, 0xf, 0x1f])
         a ^= '0b00, 0x0f'
+        assert a.tolist() == [0xf, 0, 0x10]
+
+    def test_bitwise_ops_keep_trailing_bits(self):
+        a = Array('u6', [1, 2, 3], trailing_bits='0b11')
+        a ^= '0b111111'
+        assert a.tolist() == [62, 61, 60]
+        assert a.trailing_bits == '0b11'
+        b = Array('u6') & '0b000001'
+        assert len(b) == 0
 
     def test_rshift(self):
         a = Array(dtype='u8')
@@ -840,6 +1038,16 @@ class TestAsType:
         assert a.tolist() == b.tolist()
         assert b.dtype == Dtype('float16')
 
+    def test_switching_between_int_and_float_types(self):
+        a = Array('<h', [-300, 0, 7], trailing_bits='0b1')
+        b = a.astype('float32')
+        assert b.tolist() == [-300.0, 0.0, 7.0]
+        assert not b.trailing_bits
+        c = b.astype('i12')
+        assert c.tolist() == [-300, 0, 7]
+        with pytest.raises(ValueError):
+            _ = a.astype('u8')
+
 
 class TestReverseMethods:
 
@@ -858,6 +1066,13 @@ class TestReverseMethods:
         b = 100 - a
         assert b.equals(Array('int90', [101, 110, 200]))
 
+    def test_rsub_unsigned(self):
+        a = Array('u8', [1, 10, 100])
+        b = 100 - a
+        assert b.equals(Array('u8', [99, 90, 0]))
+        with pytest.raises(ValueError):
+            _ = 5 - a
+
     def test_rmod(self):
         a = Array('i8', [1, 2, 4, 8, 10])
         with pytest.raises(TypeError):
@@ -51,6 +51,14 @@ class TestNoPosAttribute:
         s.replace('0b1', '0b11')
         assert s == '0b011'
 
+    def test_replace_overlapping_matches(self):
+        a = BitArray('0b0000000')
+        assert a.replace('0b000', '0b1') == 2
+        assert a == '0b110'
+        a = BitArray(10000) + '0b1'
+        assert a.replace(Bits(40), '0b11', count=3) == 3
+        assert a == Bits('0b111111') + Bits(9880) + '0b1'
+
     def test_delete(self):
         s = BitArray('0b000000001')
         del s[-1:]
@@ -87,6 +95,40 @@ class TestNoPosAttribute:
         s.overwrite('0b000', 1)
         assert s == '0b00000'
 
+    def test_overwrite_past_end(self):
+        s = BitArray('0b01110')
+        s.overwrite('0b0011', 3)
+        assert s == '0b0110011'
+        s.overwrite('0xf', len(s))
+        assert s == '0b01100111111'
+
+    def test_mutating_with_bits_leaves_it_unchanged(self):
+        t = Bits('0b101')
+        s = BitArray('0b0')
+        s.append(t)
+        s.prepend(t)
+        s.insert(t, 1)
+        s.overwrite(t, 0)
+        s |= t + '0b0000000'
+        assert s == '0b1011010101'
+        assert t == '0b101'
+        s.append(s)
+        assert s == '0b10110101011011010101'
+
+    def test_rotate_and_reverse_slices(self):
+        s = BitArray('0b1100101110')
+        s.ror(3, 2, 8)
+        assert s == '0b1101100110'
+        s.rol(3, 2, 8)
+        assert s == '0b1100101110'
+        s.reverse(1, -1)
+        assert s == '0b1111010010'
+        s = BitArray('0b0011100000000000')
+        s.rol(2, 1, 6)
+        assert s == '0b0110010000000000'
+        s.ror(4, 1, 6)
+        assert s == '0b0100110000000000'
+
     def test_overwrite_no_pos(self):
         s = BitArray('0x01234')
         with pytest.raises(TypeError):
@@ -179,6 +221,14 @@ class TestByteAligned:
         assert a == '0x000ff'
         bitstring.bytealigned = False
 
+    def test_byte_aligned_replace_overlapping(self):
+        a = BitArray('0x000000 0f')
+        assert a.replace('0x0000', '0xab', bytealigned=True) == 1
+        assert a == '0xab000f'
+        a = BitArray('0x80000000, 0b00000')
+        assert a.replace('0x00', '0b1', start=1, end=29, bytealigned=True) == 2
+        assert a == '0x80, 0b11, 0x00, 0b00000'
+
 
 class TestSliceAssignment:
 
@@ -334,6 +384,11 @@ class TestClear:
         s = BitArray('0xfff')
         s.clear()
         assert s.len == 0
+        s.append('0b1')
+        assert s == '0b1'
+        t = bitstring.BitStream('0xfff', pos=4)
+        t.clear()
+        assert t.pos == 0
 
 
 class TestCopy:
@@ -456,6 +511,11 @@ class TestLsb0Setting:
     def test_any(self):
         a = BitArray('0b0001')
         assert a.any(1, [0, 1, 2])
+        assert a.any(0, (p for p in range(4) if p != 1))
+        assert not a.any(1, [])
+        assert a.all(0, [])
+        with pytest.raises(IndexError):
+            a.any(1, [4])
 
     def test_endswith(self):
         a = BitArray('0xdeadbeef')
@@ -561,6 +621,12 @@ class TestLsb0Setting:
         assert n == 2
         assert a == '0xaa0000ff00ff'
 
+    def test_byte_swap_mixed_pattern_offset(self):
+        a = BitArray('0b11') + '0x0102030405060708' + '0b0'
+        n = a.byteswap([1, 2], start=1)
+        assert n == 2
+        assert a == BitArray('0b11') + '0x0102040305070608' + '0b0'
+
     def test_insert(self):
         a = BitArray('0x0123456')
         a.insert('0xf', 4)
@@ -612,6 +678,19 @@ class TestLsb0Setting:
         a.set(False, 0)
         assert a == '0b110'
 
+    def test_set_many(self):
+        a = BitArray(12)
+        a.set(1, [0, 3, -1])
+        assert a == '0b100000001001'
+        a.set(1, range(4, 8))
+        assert a == '0b100011111001'
+        a.set(0, (p for p in [0, -12]))
+        assert a == '0b100011111000'
+        with pytest.raises(IndexError):
+            a.set(1, [12])
+        a.set(1)
+        assert a.all(1)
+
     def test_failing_repr(self):
         a = BitArray('0b010')
         a.find('0b1')
@@ -52,6 +52,14 @@ class TestCreation:
     def test_creation_from_hex_with_whitespace(self):
         s = Bits(hex='  \n0 X a  4e       \r3  \n')
         assert s.hex == 'a4e3'
+        s = Bits(hex='a\u00a04e\u2003_3')
+        assert s.hex == 'a4e3'
+        assert Bits('0b1\x1c0') == '0b10'
+
+    @pytest.mark.parametrize("literal", ['0x', '0x ', '0b\t', '0o \n'])
+    def test_creation_from_prefix_only_literal(self, literal: str):
+        with pytest.raises(ValueError):
+            Bits(literal)
 
     @pytest.mark.parametrize("bad_val", ['0xx0', '0xX0', '0Xx0', '-2e'])
     def test_creation_from_hex_errors(self, bad_val: str):
@@ -172,6 +180,11 @@ class TestCreation:
         with pytest.raises(bitstring.CreationError):
             _ = Bits(bool=0, length=2)
 
+    def test_creation_from_iterable(self):
+        assert Bits([1, 0, '', None, 2, -1, 0.0, [0]]) == '0b10001101'
+        assert Bits(x % 3 for x in range(6)) == '0b011011'
+        assert Bits(()) == Bits()
+
     def test_creation_keyword_error(self):
         with pytest.raises(bitstring.CreationError):
             Bits(squirrel=5)
@@ -318,6 +331,81 @@ class TestFileBased:
         del x[12:24]
         assert x == '0x456abcdef587'
 
+    def test_whole_byte_offset(self):
+        filename = os.path.join(THIS_DIR, 'smalltestfile')
+        x = Bits(filename=filename, offset=8, length=16)
+        assert x == '0x2345'
+        assert x[-1] and not x[-2]
+        assert x[-4:].hex == '5'
+        y = BitArray(filename=filename, offset=56)
+        y.append('0b1')
+        assert y == '0xef, 0b1'
+        with pytest.raises(bitstring.CreationError):
+            _ = Bits(filename=filename, offset=56, length=16)
+
+    def test_count_with_length(self):
+        filename = os.path.join(THIS_DIR, 'smalltestfile')
+        assert Bits(filename=filename, length=12).count(1) == 2
+        assert Bits(filename=filename, length=12).count(0) == 10
+        assert self.a.count(1) == 32
+
+    def test_bit_operators_with_length(self):
+        filename = os.path.join(THIS_DIR, 'smalltestfile')
+        a = Bits(filename=filename, length=12)
+        assert a & '0xff0' == '0x010'
+        assert '0x00f' | a == '0x01f'
+        assert a ^ a == Bits(12)
+        b = BitArray('0xfff')
+        b &= a
+        assert b == '0x012'
+
+    def test_invert_with_length(self):
+        a = Bits(filename=os.path.join(THIS_DIR, 'test.m1v'), length=16)
+        b = ~a
+        assert len(b) == 16
+        assert b == ~Bits(a.tobytes())
+        assert ~self.c == '0xa987'
+
+    def test_indexing_with_length(self):
+        filename = os.path.join(THIS_DIR, 'smalltestfile')
+        a = Bits(filename=filename, length=12)
+        assert a[7] and a[-2]
+        assert not a[-1] and not a[-12]
+        with pytest.raises(IndexError):
+            _ = a[12]
+        with pytest.raises(IndexError):
+            _ = a[-13]
+
+    def test_iter_with_length(self):
+        filename = os.path.join(THIS_DIR, 'smalltestfile')
+        assert list(Bits(filename=filename, length=12)) == [False] * 7 + [True, False, False, True, False]
+
+    def test_equality_with_length(self):
+        filename = os.path.join(THIS_DIR, 'smalltestfile')
+        a = Bits(filename=filename, length=12)
+        assert a == '0x012'
+        assert a == Bits(filename=filename, length=12)
+        assert a != Bits(filename=filename, length=16)
+        assert a != Bits(filename=filename)
+
+    def test_join_with_length(self):
+        filename = os.path.join(THIS_DIR, 'smalltestfile')
+        a = Bits(filename=filename, length=12)
+        assert Bits().join([a, a]) == '0x012012'
+        assert Bits('0b1').join([a, a]) == Bits('0x012, 0b1, 0x012')
+        b = BitArray('0b0')
+        b.append(a)
+        assert b == '0b0, 0x012'
+
+    def test_all_and_any_with_length(self):
+        filename = os.path.join(THIS_DIR, 'smalltestfile')
+        a = Bits(filename=filename, length=7)
+        assert a.all(0)
+        assert not a.any(1)
+        a = Bits(filename=filename, length=8)
+        assert not a.all(0)
+        assert a.any(1)
+
 
 class TestComparisons:
     def test_unorderable(self):
@@ -387,6 +475,12 @@ class TestPadToken:
         a, b = t.unpack('pad:9, ue, int3')
         assert (a, b) == (12, -1)
 
+    def test_unpack_same_format_different_keywords(self):
+        s = Bits('0x0ff0')
+        assert s.unpack('uint:n, bin', n=4) == [0, '111111110000']
+        assert s.unpack('uint:n, bin', n=8) == [15, '11110000']
+        assert s.unpack('uint:n, bin', n=4) == [0, '111111110000']
+
 
 class TestModifiedByAddingBug:
 
@@ -473,6 +567,14 @@ class TestContainsBug:
         assert '0b1' in Bits('0xf')
         assert not '0b0' in Bits('0xf')
 
+    def test_contains_bytes(self):
+        a = Bits('0x00dead00, 0b1')
+        assert b'\xde\xad' in a
+        assert b'\x00' in a[4:]
+        assert bytearray(b'\xbd\x5a') in a[1:]
+        assert not b'\xff' in a
+        assert not b'\x00\x80' in a
+
 
 class TestByteStoreImmutablity:
 
@@ -537,6 +639,9 @@ class TestLsb0Indexing:
         a = Bits('0b000111')
         assert a.all(1, [0, 1, 2])
         assert a.all(0, [3, 4, 5])
+        assert a.all(1, range(3))
+        assert a.all(0, range(5, 2, -1))
+        assert not a.all(0, range(0, 6, 2))
 
     def test_any(self):
         a = Bits('0b00000110')
@@ -74,6 +74,23 @@ class TestReading:
         s.bitpos += 1
         assert s.read(2 * 8).bin == '1000100100010000'
 
+    def test_read_fixed_length_tokens(self):
+        s = ConstBitStream('0xc001, 0x80, 0x01, floatle:32=0.25, 0b10')
+        assert s.read('uint:16') == 0xc001
+        assert s.read('uint:8') == 0x80
+        assert s.read('int:8') == 1
+        assert s.read('floatle:32') == 0.25
+        assert s.read('bool') is True
+        assert s.read('bool') is False
+        with pytest.raises(bitstring.ReadError):
+            s.read('bool')
+        s.pos = 1
+        assert s.read('uint:8') == 0x80
+        s.pos = 48
+        with pytest.raises(bitstring.ReadError):
+            s.read('uint:32')
+        assert s.pos == 48
+
     def test_read_ue(self):
         with pytest.raises(bitstring.InterpretError):
             _ = BitStream('').ue
@@ -85,6 +102,14 @@ class TestReading:
         with pytest.raises(bitstring.ReadError):
             s.read('ue')
 
+    def test_read_exp_golomb_from_position(self):
+        s = ConstBitStream('uint:7=3, ue=10, se=-4, uie=5, sie=-2')
+        s.pos = 7
+        assert s.read('ue') == 10
+        assert s.readlist('se, uie, sie') == [-4, 5, -2]
+        with pytest.raises(bitstring.ReadError, match='Read off end'):
+            s.read('ue')
+
     def test_read_se(self):
         s = BitStream(bin='010 00110 0001010 0001000 00111')
         assert s.read('se') == 1
@@ -206,6 +231,30 @@ class TestRfind:
         assert b == (8,)
         assert a.pos == 8
 
+    def test_find_whole_bytes_overlapping(self):
+        a = BitStream('0x0f0000000f')
+        assert a.rfind('0x0000', bytealigned=True) == (16,)
+        assert a.rfind('0x0000', end=31, bytealigned=True) == (8,)
+        assert list(a.findall('0x0000', bytealigned=True)) == [8, 16]
+        assert list(a.findall('0x0000', bytealigned=True, count=1)) == [8]
+
+    def test_find_long_pattern_at_any_offset(self):
+        pattern = Bits('0xfedcba9876543210, 0b101')
+        for offset in range(9):
+            a = BitStream(10000 + offset) + pattern + Bits(20001) + pattern + Bits(5000)
+            first, last = 10000 + offset, 10000 + offset + len(pattern) + 20001
+            assert a.find(pattern) == (first,)
+            assert a.rfind(pattern) == (last,)
+            assert a.find(pattern, start=first + 1) == (last,)
+            assert a.rfind(pattern, end=last + len(pattern) - 1) == (first,)
+            assert a.find(pattern, end=first + len(pattern) - 1) == ()
+            assert a.find(pattern, start=first) == (first,)
+
+    def test_find_long_pattern_in_repetitive_data(self):
+        a = BitStream(100000) + '0b1'
+        assert a.find(Bits(40) + '0b1') == (99960,)
+        assert a.rfind(Bits(40)) == (99960,)
+
     def test_rfind_endbit(self):
         a = BitStream('0x000fff')
         b = a.rfind('0b011', start=0, end=14, bytealigned=False)
@@ -1496,6 +1545,12 @@ class TestAdding:
         assert s.bin == '1100011000'
         s.prepend('')
         assert s.bin == '1100011000'
+        t = Bits('0b1')
+        s.pos = 4
+        s.prepend(t)
+        assert s.bin == '11100011000'
+        assert s.pos == 0
+        assert t.bin == '1'
 
     def test_null_slice(self):
         s = BitStream('0x111')
@@ -2832,6 +2887,24 @@ class TestSplit2:
         assert hash(a) == hash(b)
         assert hash(a) != hash(c)
 
+    def test_hash_is_cached(self):
+        a = ConstBitStream('0xabcd')
+        h = hash(a)
+        assert a._hash == h
+        assert hash(a) == h
+        b = copy.deepcopy(a)
+        assert b._hash == -1
+        assert hash(b) == h
+
+    def test_subclass_attributes_survive_copying_state(self):
+        class TaggedBits(ConstBitStream):
+            pass
+        t = TaggedBits('0xabcd')
+        t.tag = 'x'
+        u = copy.deepcopy(t)
+        assert u.tag == 'x'
+        assert u == t
+
     def test_const_bit_stream_copy(self):
         a = ConstBitStream('0xabc')
         a.pos = 11
@@ -2934,6 +3007,14 @@ class TestInvert:
         a.invert([0, 1, -1])
         assert a == '0b110110'
 
+    def test_invert_repeated_bits(self):
+        a = BitStream('0b111000')
+        a.invert([1, 1, 2, -4, 4, 4, 4])
+        assert a == '0b111010'
+        with pytest.raises(IndexError):
+            a.invert([0, -7])
+        assert a == '0b111010'
+
     def test_invert_whole_bit_stream(self):
         a = BitStream('0b11011')
         a.invert()
@@ -2996,6 +3077,15 @@ class TestAllAndAny:
         assert a.all(True, [-1])
         assert not a.all(True, [0])
 
+    def test_all_with_range(self):
+        a = BitStream('0b01011')
+        assert a.all(True, range(1, 5, 2))
+        assert a.all(True, range(4, 0, -3))
+        assert not a.all(True, range(5))
+        assert a.any(False, range(4, -1, -2))
+        with pytest.raises(IndexError):
+            a.all(True, range(1, 7, 2))
+
     def test_file_based_all(self):
         filename = os.path.join(THIS_DIR, 'test.m1v')
         a = BitStream(filename=filename)
@@ -3505,6 +3595,16 @@ class TestBugs:
         assert a == b == '101'
         assert c == d == e == 3
 
+    def test_multiplicative_factors_reading_whole_bytes(self):
+        s = ConstBitStream('0b1, 3*uintle:16=513, 0b1010101')
+        assert s.readlist('bool, 3*uintle:16') == [True, 513, 513, 513]
+        s = ConstBitStream('0x0102, 2*intbe:32=-7, 2*floatle:32=0.5')
+        assert s.readlist('2*uint:8, 2*intbe:32, 2*floatle:32') == [1, 2, -7, -7, 0.5, 0.5]
+        s.pos = 8
+        with pytest.raises(bitstring.ReadError):
+            s.readlist('100*uint:8')
+        assert s.pos == 8
+
     def test_multiplicative_factors_packing(self):
         s = pack('3*bin', '1', '001', '101')
         assert s == '0b1001101'
@@ -3918,6 +4018,26 @@ class TestCount:
         assert b.count(1) == 16
         assert b.count(0) == 14
 
+    def test_and_count(self):
+        a = ConstBitStream('0xff0120ff')
+        assert a.and_count('0x0f0f0f0f') == 9
+        assert a[1:-1].and_count(a[2:]) == 13
+        assert BitStream().and_count('') == 0
+        with pytest.raises(ValueError):
+            a.and_count('0xf')
+
+    def test_or_count_and_xor_count(self):
+        a = ConstBitStream('0xff0120ff')
+        b = ConstBitStream('0x0f0f0f0f')
+        assert a.or_count(b) == (a | b).count(1) == 25
+        assert a.xor_count(b) == (a ^ b).count(1) == 16
+        assert a[1:-1].xor_count(a[2:]) == (a[1:-1] ^ a[2:]).count(1)
+        assert BitStream().or_count('') == BitStream().xor_count('') == 0
+        with pytest.raises(ValueError):
+            a.or_count('0xf')
+        with pytest.raises(ValueError):
+            a.xor_count('0xf')
+
 
 class TestZeroBitReads:
     def test_integer(self):
@@ -3952,6 +4072,15 @@ class TestCoverageCompletion:
         with pytest.raises(bitstring.ReadError):
             _ = s.read('ue')
 
+    def test_long_golomb_codes(self):
+        s = ConstBitStream().join([ConstBitStream(ue=(1 << 70) + 3), ConstBitStream(uie=(1 << 50) + 5),
+                                   ConstBitStream(se=-(1 << 40)), ConstBitStream(sie=-(1 << 45))])
+        assert s.readlist('ue, uie, se, sie') == [(1 << 70) + 3, (1 << 50) + 5, -(1 << 40), -(1 << 45)]
+        assert s.pos == len(s)
+        t = ConstBitStream(uie=1 << 50)[:-1]
+        with pytest.raises(bitstring.ReadError):
+            _ = t.read('uie')
+
     def test_overwrite_with_self(self):
         s = BitStream('0b1101')
         s.overwrite(s)
@@ -231,6 +231,9 @@ def test_auto_scaling2():
     assert a.dtype.scale == 2 ** -127
     a = Array(Dtype('e2m1mxfp', scale='auto'), [0, 0, 0, 0])
     assert a.dtype.scale == 1
+    a = Array(Dtype('e3m2mxfp', scale='auto'), (x for x in [0.5, -56.0, 3]))
+    assert a.dtype.scale == 2
+    assert a.tolist() == [0.5, -56.0, 3.0]
 
 
 def test_auto_scaling_error():